@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 병합(coalescing) + 경로별 동시 처리 제한(admission control) 미들웨어
+
+트래픽이 몰릴 때 같은 요청이 수백 개씩 동시에 들어오는 비싼 경로에 적용한다.
+
+- 병합: 같은 GET 요청(메서드 + 경로 + 쿼리)이 처리 중이면 새로 계산하지 않고
+  먼저 온 요청(리더)의 응답을 그대로 받아 돌려준다
+- 동시 처리 제한: 경로 정책마다 동시에 처리하는 요청 수를 제한하고 나머지는 대기열에서 기다린다
+  - 대기열이 가득 차면 즉시 429
+  - 대기 시간이 기한(queue_timeout)을 넘으면 503
+  (둘 다 Retry-After 헤더 포함)
+- 정책별 요청/병합/거부 카운터와 최근 응답 시간 p50/p99를 기록한다
+
+순수 ASGI 미들웨어이며 이벤트 루프 한 개 안에서만 상태를 바꾸므로 잠금이 필요 없다.
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple
+
+LATENCY_WINDOW = 1024  # p50/p99 계산에 쓰는 최근 요청 수
+RETRY_AFTER_SECONDS = 1
+
+
+class RoutePolicy:
+    """경로 정책 (정규식으로 경로 매칭)"""
+    __slots__ = ("name", "pattern", "max_concurrency", "max_queue", "queue_timeout", "coalesce")
+
+    def __init__(self, name: str, pattern: str, max_concurrency: int = 8, max_queue: int = 64,
+                 queue_timeout: float = 2.0, coalesce: bool = True):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.coalesce = coalesce
+
+
+class _QueueFull(Exception):
+    pass
+
+
+class _Gate:
+    """동시 처리 슬롯 + FIFO 대기열"""
+
+    def __init__(self, limit: int, max_queue: int):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.peak_queued = 0
+        self.waiters: deque = deque()
+
+    async def acquire(self, timeout: float) -> bool:
+        """슬롯 획득 (기한 안에 못 받으면 False, 대기열이 가득 차면 _QueueFull)"""
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            return True
+        if len(self.waiters) >= self.max_queue:
+            raise _QueueFull()
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.peak_queued = max(self.peak_queued, len(self.waiters))
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            # 기한과 동시에 슬롯을 넘겨받은 경우
+            return waiter.done() and not waiter.cancelled()
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소되면 다음 대기자에게 넘긴다
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            try:
+                self.waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self):
+        """슬롯 반납 (대기자가 있으면 슬롯을 그대로 넘김)"""
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class _RouteState:
+    """정책별 실행 상태 + 카운터"""
+
+    def __init__(self, policy: RoutePolicy):
+        self.policy = policy
+        self.gate = _Gate(policy.max_concurrency, policy.max_queue)
+        self.inflight: Dict[Tuple[str, str, bytes], asyncio.Future] = {}
+        self.requests = 0
+        self.coalesced = 0
+        self.shed_queue_full = 0
+        self.shed_deadline = 0
+        self.latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 2)
+
+        return {
+            "limits": {
+                "max_concurrency": self.policy.max_concurrency,
+                "max_queue": self.policy.max_queue,
+                "queue_timeout": self.policy.queue_timeout,
+                "coalesce": self.policy.coalesce,
+            },
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "shed": self.shed_queue_full + self.shed_deadline,
+            "shed_queue_full": self.shed_queue_full,
+            "shed_deadline": self.shed_deadline,
+            "active": self.gate.active,
+            "queued": len(self.gate.waiters),
+            "peak_queued": self.gate.peak_queued,
+            "inflight_keys": len(self.inflight),
+            "latency_ms": {"p50": percentile(0.5), "p99": percentile(0.99), "samples": len(latencies)},
+        }
+
+
+def _shed_response(status: int, detail: str) -> List[Dict[str, Any]]:
+    body = json.dumps({"detail": detail}, ensure_ascii=False).encode('utf-8')
+    return [
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(RETRY_AFTER_SECONDS).encode()),
+            ],
+        },
+        {"type": "http.response.body", "body": body},
+    ]
+
+
+class AdmissionController:
+    """경로 정책 목록 + 정책별 상태 (미들웨어와 상태 조회 API가 공유)"""
+
+    def __init__(self, policies: List[RoutePolicy]):
+        self.routes = [_RouteState(policy) for policy in policies]
+
+    def match(self, path: str) -> Optional[_RouteState]:
+        for route in self.routes:
+            if route.policy.pattern.match(path):
+                return route
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        routes = {route.policy.name: route.stats() for route in self.routes}
+        return {
+            "routes": routes,
+            "totals": {
+                key: sum(r[key] for r in routes.values())
+                for key in ("requests", "coalesced", "shed", "shed_queue_full", "shed_deadline")
+            },
+        }
+
+
+class AdmissionControlMiddleware:
+    """AdmissionController 정책을 적용하는 ASGI 미들웨어"""
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        route = self.controller.match(scope["path"])
+        if route is None:
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        route.requests += 1
+        method = scope["method"]
+        key = (method, scope["path"], scope.get("query_string", b""))
+        coalesce = route.policy.coalesce and method in ("GET", "HEAD")
+
+        # 같은 요청이 처리 중이면 그 결과를 기다림
+        if coalesce and key in route.inflight:
+            route.coalesced += 1
+            messages = await asyncio.shield(route.inflight[key])
+            if messages is not None:
+                await self._replay(send, messages)
+                route.latencies.append(time.perf_counter() - start)
+                return
+            # 리더가 실패하면 직접 처리
+
+        leader: Optional[asyncio.Future] = None
+        if coalesce and key not in route.inflight:
+            leader = asyncio.get_running_loop().create_future()
+            route.inflight[key] = leader
+
+        messages = None
+        try:
+            messages = await self._admit_and_run(route, scope, receive)
+        finally:
+            if leader is not None:
+                route.inflight.pop(key, None)
+                leader.set_result(messages)
+
+        await self._replay(send, messages)
+        route.latencies.append(time.perf_counter() - start)
+
+    async def _admit_and_run(self, route: _RouteState, scope, receive) -> List[Dict[str, Any]]:
+        """슬롯을 받아 앱 실행, 응답 메시지를 모아서 반환 (거부 시 429/503 응답)"""
+        gate = route.gate
+        try:
+            admitted = await gate.acquire(route.policy.queue_timeout)
+        except _QueueFull:
+            route.shed_queue_full += 1
+            return _shed_response(429, "요청이 많아 잠시 후 다시 시도해 주세요")
+        if not admitted:
+            route.shed_deadline += 1
+            return _shed_response(503, "요청 대기 시간이 초과되었습니다")
+
+        messages: List[Dict[str, Any]] = []
+
+        async def capture(message):
+            messages.append(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            gate.release()
+        return messages
+
+    @staticmethod
+    async def _replay(send, messages: List[Dict[str, Any]]):
+        # 바깥 미들웨어(CORS 등)가 헤더 목록을 고칠 수 있으므로 요청마다 복사해서 보낸다
+        for message in messages:
+            if "headers" in message:
+                message = {**message, "headers": list(message["headers"])}
+            await send(dict(message))
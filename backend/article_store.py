@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 기사 통합 저장소
+
+gu_news_articles.json, gu_audit_news.json, assembly_member_news.json,
+assembly_member_lda_analysis.json(issues[].articles), issue_articles_tracking.json
+에 중복으로 들어있는 기사를 하나의 저장소에 모은다.
+
+- 기사 ID: originallink(없으면 link)의 해시
+- 기사 레코드: __slots__ 객체, 반복 문자열은 인터닝
+  (같은 ID라도 제목/본문 요약이 다르면 원본 그대로 별도 레코드로 보관)
+- 구/의원/이슈별 뷰는 기사 인덱스 배열(array)만 보관
+- 재배포(신디케이션) 기사는 MinHash LSH로 후보를 찾고 정확한 자카드 유사도로 확인해
+  대표 기사와의 관계(aliases)만 기록한다. 뷰는 각자 원래 기사를 그대로 가리킨다
+- 기사 본문은 응답 시점에만 조인한다
+- 뷰 메타데이터는 읽기 전용이며, 증분 적재 시 새 메타데이터로 교체한다(copy-on-write)
+"""
+
+import bisect
+import hashlib
+import html
+import json
+import re
+import threading
+import time
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+import numpy as np
+
+from frozen import freeze, overlay
+
+# MinHash 설정 (해시 함수 64개 = 16밴드 x 4행, LSH 후보는 정확한 자카드 유사도로 확인)
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+MINHASH_THRESHOLD = 0.8
+MINHASH_MIN_SHINGLES = 8
+
+# 해시 함수 계수 (h(x) = a*x + b mod 2^64, a는 홀수). 시드 고정으로 재시작해도 같은 결과
+_minhash_rng = np.random.default_rng(20240821)
+_MINHASH_A = _minhash_rng.integers(0, 1 << 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_MINHASH_B = _minhash_rng.integers(0, 1 << 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+# 밴드의 행들을 64비트 정수 키 하나로 접는 계수 (키 충돌은 자카드 확인에서 걸러진다)
+_MINHASH_BAND_MIX = (
+    _minhash_rng.integers(0, 1 << 63, size=MINHASH_PERMUTATIONS // MINHASH_BANDS, dtype=np.uint64)
+    * np.uint64(2) + np.uint64(1)
+)
+
+# 키워드 상위 N개
+TOP_KEYWORDS = 20
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> List[str]:
+    """HTML 제거 후 소문자 단어 목록"""
+    return _TOKEN_RE.findall(_TAG_RE.sub(" ", html.unescape(text)).lower())
+
+
+def _keywords(title: str, description: str) -> List[str]:
+    """키워드 집계용 단어 (2글자 이상, 숫자 제외)"""
+    return [t for t in _tokens(f"{title} {description}") if len(t) >= 2 and not t.isdigit()]
+
+
+def article_id(article: Dict[str, Any]) -> str:
+    """기사 고유 ID (originallink 해시, 없으면 link 해시)"""
+    key = article.get('originallink') or article.get('link') or article.get('title', '')
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _shingles(title: str, description: str) -> set:
+    """제목+본문 요약의 단어 2-gram 64비트 해시 집합"""
+    tokens = _tokens(f"{title} {description}")
+    shingles = set()
+    for i in range(len(tokens) - 1):
+        gram = f"{tokens[i]} {tokens[i + 1]}".encode('utf-8')
+        shingles.add((zlib.crc32(gram) << 32) | zlib.crc32(gram, 0x9E3779B9))
+    return shingles
+
+
+def minhash_signature(shingles: set) -> np.ndarray:
+    """MinHash 시그니처 계산 (해시 함수별 최솟값, uint64 배열)"""
+    values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+    # uint64 곱셈/덧셈은 2^64에서 자연스럽게 순환한다
+    return (np.multiply.outer(_MINHASH_A, values) + _MINHASH_B[:, None]).min(axis=1)
+
+
+def _band_keys(signature: np.ndarray) -> List[int]:
+    """밴드별 LSH 키 (밴드의 행들을 64비트 정수 하나로 접음)"""
+    rows = signature.reshape(MINHASH_BANDS, -1)
+    return (rows * _MINHASH_BAND_MIX).sum(axis=1, dtype=np.uint64).tolist()
+
+
+def jaccard_similarity(shingles: set, other: array) -> float:
+    """shingle 집합과 다른 기사 shingle 배열의 정확한 자카드 유사도"""
+    common = sum(1 for h in other if h in shingles)
+    union = len(shingles) + len(other) - common
+    return common / union if union else 0.0
+
+
+class Article:
+    """기사 레코드 (저장소 내 단일 사본)"""
+    __slots__ = ("id", "title", "description", "link", "originallink", "pub_date")
+
+    def __init__(self, id: str, title: str, description: str, link: str, originallink: str, pub_date: str):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.link = link
+        self.originallink = originallink
+        self.pub_date = pub_date
+
+    def same_content(self, raw: Dict[str, Any]) -> bool:
+        """원본 기사 dict와 필드가 모두 같은지"""
+        return (
+            self.title == raw.get('title', '')
+            and self.description == raw.get('description', '')
+            and self.link == raw.get('link', '')
+            and self.originallink == raw.get('originallink', '')
+            and self.pub_date == raw.get('pubDate', '')
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        # 원본 데이터셋의 필드(originallink 포함, 비어 있어도)를 그대로 내보내고 id만 추가
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "link": self.link,
+            "pubDate": self.pub_date,
+            "originallink": self.originallink,
+        }
+
+
+class NewsView:
+    """기사 인덱스 목록 + 뷰 메타데이터 (구/의원/이슈 단위)
+
+    tags가 있으면 기사마다 (member_name, member_party, member_district)를 함께 보관한다.
+    meta는 읽기 전용이라 응답 중인 요청과 공유해도 안전하다 (변경은 교체로만).
+    """
+    __slots__ = ("meta", "refs", "tags")
+
+    def __init__(self, meta: Dict[str, Any], tagged: bool = False):
+        self.meta = freeze(meta)
+        self.refs = array('I')
+        self.tags: Optional[List[Tuple[str, str, str]]] = [] if tagged else None
+
+    def __contains__(self, entry: Tuple[int, Optional[Tuple[str, str, str]]]) -> bool:
+        """(기사 인덱스, 태그)가 이미 있는지 (뷰가 작아서 refs를 직접 훑는다)"""
+        index, tag = entry
+        if self.tags is None or index not in self.refs:
+            return index in self.refs
+        pos = -1
+        try:
+            while True:
+                pos = self.refs.index(index, pos + 1)
+                if self.tags[pos] == tag:
+                    return True
+        except ValueError:
+            return False
+
+    def add(self, index: int, tag: Optional[Tuple[str, str, str]] = None, front: bool = False) -> bool:
+        """기사 추가 (이미 있으면 False). front=True면 최신 기사로 맨 앞에 넣는다."""
+        if (index, tag) in self:
+            return False
+        if front:
+            self.refs.insert(0, index)
+            if self.tags is not None:
+                self.tags.insert(0, tag)
+        else:
+            self.refs.append(index)
+            if self.tags is not None:
+                self.tags.append(tag)
+        return True
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+
+class LdaProfile:
+    """의원별 LDA 분석 결과 (이슈별 기사는 NewsView로 보관)"""
+    __slots__ = ("meta", "issues")
+
+    def __init__(self, meta: Dict[str, Any]):
+        self.meta = freeze(meta)
+        self.issues: List[NewsView] = []
+
+
+class ArticleStore:
+    """중복 제거된 기사 저장소"""
+
+    def __init__(self):
+        self.articles: List[Article] = []
+        self.index_by_id: Dict[str, int] = {}  # 기사 ID -> 처음 들어온 레코드
+        self.variants: Dict[str, List[int]] = {}  # 같은 ID인데 내용이 다른 레코드들 (2개 이상인 경우만)
+        self.aliases: Dict[str, str] = {}  # 근사 중복 기사 ID -> 대표 기사 ID (관계 기록용)
+        self.gu_news: Dict[str, NewsView] = {}
+        self.gu_audit: Dict[str, NewsView] = {}
+        self.member_news: Dict[str, NewsView] = {}
+        self.member_lda: Dict[str, LdaProfile] = {}
+        self.issues: Dict[str, NewsView] = {}
+        # 키워드 집계 (gu_news / gu_audit / issues -> 키 -> Counter)
+        self.keywords: Dict[str, Dict[str, Counter]] = {"gu_news": {}, "gu_audit": {}, "issues": {}}
+        # 제목 검색 색인 (단어 -> 기사 인덱스), 접두어 검색용 정렬 단어 목록
+        self.title_index: Dict[str, array] = {}
+        self._vocabulary: List[str] = []
+        self.total_occurrences = 0
+        self.ingested = 0
+        # 적재(ingest)와 조회(join)가 서로 다른 스레드에서 일어나므로 잠금
+        self.lock = threading.RLock()
+        self._strings: Dict[str, str] = {}
+        self._tags: Dict[Tuple[str, str, str], Tuple[str, str, str]] = {}
+        # LSH 색인: 밴드별 {밴드 키: 대표 기사 인덱스}. 버킷 대부분이 기사 1개라 int로 두고,
+        # 두 번째 기사가 들어올 때 array('I')로 바꾼다
+        self._lsh_buckets: List[Dict[int, Union[int, array]]] = [{} for _ in range(MINHASH_BANDS)]
+        self._shingles: Dict[int, array] = {}  # 대표 기사 인덱스 -> shingle 해시 배열
+
+    def intern(self, value: str) -> str:
+        """반복 문자열 인터닝"""
+        return self._strings.setdefault(value, value)
+
+    def intern_tag(self, article: Dict[str, Any]) -> Tuple[str, str, str]:
+        tag = (
+            self.intern(article.get('member_name', '')),
+            self.intern(article.get('member_party', '')),
+            self.intern(article.get('member_district', '')),
+        )
+        return self._tags.setdefault(tag, tag)
+
+    # ----------------------------------------
+    # 적재
+    # ----------------------------------------
+
+    def add_article(self, raw: Dict[str, Any]) -> int:
+        """기사 추가 후 저장소 인덱스 반환 (같은 ID·같은 내용이면 기존 인덱스)"""
+        self.total_occurrences += 1
+        aid = article_id(raw)
+        first = self.index_by_id.get(aid)
+        if first is not None:
+            for index in self.variants.get(aid, (first,)):
+                if self.articles[index].same_content(raw):
+                    return index
+            # 같은 기사인데 데이터셋마다 제목/요약이 다름: 원본 그대로 따로 보관
+            index = self._append_article(aid, raw)
+            self.variants.setdefault(aid, [first]).append(index)
+            return index
+
+        index = self._append_article(aid, raw)
+        self.index_by_id[aid] = index
+
+        # 근사 중복 (재배포 기사) 탐색: 대표 기사만 LSH 색인에 넣는다
+        shingles = _shingles(raw.get('title', ''), raw.get('description', ''))
+        if len(shingles) >= MINHASH_MIN_SHINGLES:
+            signature = minhash_signature(shingles)
+            duplicate = self._find_near_duplicate(signature, shingles)
+            if duplicate is not None:
+                self.aliases[aid] = self.articles[duplicate].id
+            else:
+                self._shingles[index] = array('Q', shingles)
+                for buckets, band_key in zip(self._lsh_buckets, _band_keys(signature)):
+                    postings = buckets.get(band_key)
+                    if postings is None:
+                        buckets[band_key] = index
+                    elif isinstance(postings, int):
+                        buckets[band_key] = array('I', (postings, index))
+                    else:
+                        postings.append(index)
+        return index
+
+    def _append_article(self, aid: str, raw: Dict[str, Any]) -> int:
+        index = len(self.articles)
+        title = raw.get('title', '')
+        self.articles.append(Article(
+            id=aid,
+            title=self.intern(title),
+            description=self.intern(raw.get('description', '')),
+            link=raw.get('link', ''),
+            originallink=raw.get('originallink', ''),
+            pub_date=self.intern(raw.get('pubDate', '')),
+        ))
+        self._index_title(index, title)
+        return index
+
+    def _index_title(self, index: int, title: str):
+        for token in set(_tokens(title)):
+            postings = self.title_index.get(token)
+            if postings is None:
+                token = self.intern(token)
+                postings = self.title_index[token] = array('I')
+                bisect.insort(self._vocabulary, token)
+            postings.append(index)
+
+    def _find_near_duplicate(self, signature: np.ndarray, shingles: set) -> Optional[int]:
+        """LSH 후보 중 자카드 유사도가 기준 이상이고 가장 높은 대표 기사"""
+        checked = set()
+        best, best_similarity = None, MINHASH_THRESHOLD
+        for buckets, band_key in zip(self._lsh_buckets, _band_keys(signature)):
+            postings = buckets.get(band_key, ())
+            for candidate in ((postings,) if isinstance(postings, int) else postings):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                similarity = jaccard_similarity(shingles, self._shingles[candidate])
+                if similarity >= best_similarity:
+                    best, best_similarity = candidate, similarity
+        return best
+
+    def _load_gu_views(self, data: Dict[str, Any], target: Dict[str, NewsView]):
+        for gu, gu_info in data.items():
+            if not isinstance(gu_info, dict):
+                continue
+            view = NewsView({k: v for k, v in gu_info.items() if k != 'news'})
+            for raw in gu_info.get('news', []):
+                view.add(self.add_article(raw))
+            target[self.intern(gu)] = view
+
+    def load_gu_news(self, data: Dict[str, Any]):
+        self._load_gu_views(data, self.gu_news)
+
+    def load_gu_audit(self, data: Dict[str, Any]):
+        self._load_gu_views(data, self.gu_audit)
+
+    def load_member_news(self, data: Dict[str, Any]):
+        for name, info in data.items():
+            if not isinstance(info, dict):
+                continue
+            view = NewsView({k: v for k, v in info.items() if k != 'news'})
+            for raw in info.get('news', []):
+                view.add(self.add_article(raw))
+            self.member_news[self.intern(name)] = view
+
+    def load_member_lda(self, data: Dict[str, Any]):
+        for name, info in data.items():
+            if not isinstance(info, dict):
+                continue
+            profile = LdaProfile({k: v for k, v in info.items() if k != 'issues'})
+            for issue in info.get('issues', []):
+                view = NewsView({
+                    k: (self.intern(v) if isinstance(v, str) else v)
+                    for k, v in issue.items() if k != 'articles'
+                })
+                for raw in issue.get('articles', []):
+                    view.add(self.add_article(raw))
+                profile.issues.append(view)
+            self.member_lda[self.intern(name)] = profile
+
+    def load_issues(self, data: Dict[str, Any]):
+        for issue, info in data.items():
+            if not isinstance(info, dict):
+                continue
+            issue = self.intern(issue)
+            view = NewsView({k: v for k, v in info.items() if k not in ('articles', 'top_keywords')}, tagged=True)
+            for raw in info.get('articles', []):
+                view.add(self.add_article(raw), self.intern_tag(raw))
+            self.issues[issue] = view
+            self.keywords["issues"][issue] = self._keyword_counter(info.get('top_keywords', []))
+
+    def _keyword_counter(self, top_keywords: List[Dict[str, Any]]) -> Counter:
+        return Counter({self.intern(item['word']): item.get('count', 0) for item in top_keywords if 'word' in item})
+
+    def _load_gu_keywords(self, data: Dict[str, Any], scope: str):
+        for gu, info in data.items():
+            if isinstance(info, dict):
+                self.keywords[scope][self.intern(gu)] = self._keyword_counter(info.get('top_keywords', []))
+
+    def load_gu_keywords(self, data: Dict[str, Any]):
+        self._load_gu_keywords(data, "gu_news")
+
+    def load_gu_audit_keywords(self, data: Dict[str, Any]):
+        self._load_gu_keywords(data, "gu_audit")
+
+    # ----------------------------------------
+    # 증분 적재 (news_ingest 소비자가 호출)
+    # ----------------------------------------
+
+    def ingest(self, record: Dict[str, Any]) -> bool:
+        """신규 기사 1건을 구/의원/이슈 뷰, 검색 색인, 키워드 집계에 반영
+
+        record: 기사 필드(title, description, link, originallink, pubDate) +
+                gu, gu_type(news|audit), politician, member, member_party, member_district, issue
+        같은 레코드를 다시 적용해도 결과가 같다 (로그 재생/압축 후 재적용 대비).
+        """
+        with self.lock:
+            index = self.add_article(record)
+            words = None
+            changed = False
+
+            gu = record.get('gu')
+            if gu:
+                scope = "gu_audit" if record.get('gu_type') == 'audit' else "gu_news"
+                views = self.gu_audit if scope == "gu_audit" else self.gu_news
+                gu = self.intern(gu)
+                view = views.get(gu)
+                if view is None:
+                    view = views[gu] = NewsView({
+                        "politician": record.get('politician', ''),
+                        "collected_date": "",
+                        "total_count": 0,
+                    })
+                if view.add(index, front=True):
+                    view.meta = overlay(view.meta, total_count=view.meta.get("total_count", 0) + 1)
+                    words = words or _keywords(record.get('title', ''), record.get('description', ''))
+                    self.keywords[scope].setdefault(gu, Counter()).update(words)
+                    changed = True
+
+            member = record.get('member')
+            if member:
+                member = self.intern(member)
+                view = self.member_news.get(member)
+                if view is None:
+                    view = self.member_news[member] = NewsView({
+                        "member_info": {
+                            "name": member,
+                            "district": record.get('member_district', ''),
+                            "party": record.get('member_party', ''),
+                        },
+                        "collected_date": "",
+                        "total_count": 0,
+                    })
+                if view.add(index, front=True):
+                    view.meta = overlay(view.meta, total_count=view.meta.get("total_count", 0) + 1)
+                    changed = True
+
+            issue = record.get('issue')
+            if issue:
+                issue = self.intern(issue)
+                view = self.issues.get(issue)
+                if view is None:
+                    view = self.issues[issue] = NewsView({"members": []}, tagged=True)
+                tag = self.intern_tag({
+                    "member_name": record.get('member', ''),
+                    "member_party": record.get('member_party', ''),
+                    "member_district": record.get('member_district', ''),
+                })
+                if view.add(index, tag, front=True):
+                    words = words or _keywords(record.get('title', ''), record.get('description', ''))
+                    self.keywords["issues"].setdefault(issue, Counter()).update(words)
+                    if member:
+                        self._count_issue_member(view, tag)
+                    changed = True
+
+            if changed:
+                self.ingested += 1
+            return changed
+
+    # ----------------------------------------
+    # 조회 (응답 시점 조인)
+    # ----------------------------------------
+
+    def _count_issue_member(self, view: NewsView, tag: Tuple[str, str, str]):
+        members = list(view.meta.get("members", []))
+        for i, entry in enumerate(members):
+            if entry.get('name') == tag[0]:
+                members[i] = overlay(entry, article_count=entry.get('article_count', 0) + 1)
+                break
+        else:
+            members.append({"name": tag[0], "party": tag[1], "district": tag[2], "article_count": 1})
+        view.meta = overlay(view.meta, members=members)
+
+    def top_keywords(self, scope: str, key: str, limit: int = TOP_KEYWORDS) -> List[Dict[str, Any]]:
+        counter = self.keywords.get(scope, {}).get(key)
+        if not counter:
+            return []
+        with self.lock:
+            return [{"word": word, "count": count} for word, count in counter.most_common(limit)]
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """제목 검색 (검색어 단어마다 접두어 일치, 모든 단어를 포함하는 기사)"""
+        terms = _tokens(query)
+        if not terms:
+            return []
+        with self.lock:
+            matched: Optional[set] = None
+            for term in terms:
+                hits = set()
+                pos = bisect.bisect_left(self._vocabulary, term)
+                while pos < len(self._vocabulary) and self._vocabulary[pos].startswith(term):
+                    hits.update(self.title_index[self._vocabulary[pos]])
+                    pos += 1
+                matched = hits if matched is None else matched & hits
+                if not matched:
+                    return []
+            # 최근에 들어온 기사 우선, 같은 기사/재배포 기사는 한 번만
+            result = []
+            seen = set()
+            for i in sorted(matched, reverse=True):
+                article = self.articles[i]
+                key = self.aliases.get(article.id, article.id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                result.append(article.to_dict())
+                if len(result) >= limit:
+                    break
+            return result
+
+    def get(self, aid: str) -> Optional[Article]:
+        index = self.index_by_id.get(aid)
+        return self.articles[index] if index is not None else None
+
+    def join(self, view: NewsView, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """뷰의 기사 인덱스를 기사 본문으로 조인"""
+        with self.lock:
+            end = len(view.refs) if limit is None else min(len(view.refs), offset + limit)
+            articles = self.articles
+            result = []
+            for pos in range(offset, end):
+                item = articles[view.refs[pos]].to_dict()
+                if view.tags is not None:
+                    member_name, member_party, member_district = view.tags[pos]
+                    item["member_name"] = member_name
+                    item["member_party"] = member_party
+                    item["member_district"] = member_district
+                result.append(item)
+            return result
+
+    def render_view(self, view: NewsView, articles_key: str, offset: int = 0,
+                    limit: Optional[int] = None) -> Dict[str, Any]:
+        """뷰 메타데이터 + 조인된 기사 목록"""
+        return {
+            **view.meta,
+            articles_key: self.join(view, offset, limit),
+            "article_total": len(view),
+        }
+
+    def render_lda(self, profile: LdaProfile) -> Dict[str, Any]:
+        return {
+            **profile.meta,
+            "issues": [
+                {**issue.meta, "articles": self.join(issue)}
+                for issue in profile.issues
+            ],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "articles": len(self.articles),
+            "article_ids": len(self.index_by_id),
+            "occurrences": self.total_occurrences,
+            "near_duplicates": len(self.aliases),
+            "gu_news": len(self.gu_news),
+            "gu_audit": len(self.gu_audit),
+            "member_news": len(self.member_news),
+            "member_lda": len(self.member_lda),
+            "issues": len(self.issues),
+            "title_terms": len(self.title_index),
+            "ingested": self.ingested,
+        }
+
+
+# 데이터 파일 -> 적재 메서드
+ARTICLE_SOURCES = [
+    ("gu_news_articles.json", "load_gu_news"),
+    ("gu_audit_news.json", "load_gu_audit"),
+    ("assembly_member_news.json", "load_member_news"),
+    ("assembly_member_lda_analysis.json", "load_member_lda"),
+    ("issue_articles_tracking.json", "load_issues"),
+    ("gu_news_keywords.json", "load_gu_keywords"),
+    ("gu_audit_keywords.json", "load_gu_audit_keywords"),
+]
+
+
+def build_article_store(data_dir: Path) -> ArticleStore:
+    """모든 뉴스 데이터셋을 읽어 기사 저장소 구성 (원본 dict는 보관하지 않음)"""
+    start = time.time()
+    store = ArticleStore()
+    for filename, loader in ARTICLE_SOURCES:
+        file_path = data_dir / filename
+        if not file_path.exists():
+            print(f"⚠️ 기사 데이터 없음: {filename}")
+            continue
+        with open(file_path, 'r', encoding='utf-8') as f:
+            getattr(store, loader)(json.load(f))
+
+    stats = store.stats()
+    print(
+        f"✅ 기사 저장소 구성 완료: {stats['occurrences']}건 → {stats['articles']}건 (기사 {stats['article_ids']}개, "
+        f"근사 중복 {stats['near_duplicates']}건, {time.time() - start:.2f}초)"
+    )
+    return store
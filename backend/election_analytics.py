@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+선거 결과 분석 (previous_election_data_complete.json + real_election_data.json)
+
+선거(유형+연도)마다 선거구 x 정당 배열을 만들어 두고
+득표율, 표차(margin), 투표율, 직전 선거 대비 정당 스윙, 시군구별 정당 집계,
+접전 순위를 미리 계산한다. 읍면동은 dong_election_mapping_complete.json으로
+선거구에 연결한다.
+
+※ 현재 데이터 파일에는 candidates/voteCount/voteRate가 비어 있어
+  득표 기반 지표(득표율·표차·투표율)는 null이고 의석 기반 지표만 채워진다.
+  득표 데이터가 들어오면 같은 코드로 계산된다.
+"""
+
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+ELECTION_TYPES = {
+    "nationalAssembly": "국회의원",
+    "mayor": "시장",
+    "siUiwon": "시의원",
+    "guUiwon": "구의원",
+}
+
+# real_election_data.json (현직) 의 선거 연도
+REAL_ELECTION_YEARS = {
+    "nationalAssembly": "2024",
+    "mayor": "2022",
+    "siUiwon": "2022",
+    "guUiwon": "2022",
+}
+
+# dong_election_mapping_complete.json 의 선거구 키
+MAPPING_KEYS = {
+    "nationalAssembly": "na_uiwon",
+    "siUiwon": "si_uiwon",
+    "guUiwon": "gu_uiwon",
+}
+
+SEOUL_SIDO_CODE = "11"
+SEOUL_DISTRICT = "서울특별시"
+
+
+def _clean_name(name: str) -> str:
+    """'곽상언\\n(郭相彦)' -> '곽상언'"""
+    return (name or '').split('\n')[0].split('(')[0].strip()
+
+
+def _normalize_dong(name: str) -> str:
+    """동 이름 비교용 ('종로1.2.3.4가동' / '종로1·2·3·4가동')"""
+    return name.replace('·', '').replace('.', '').replace(',', '').strip()
+
+
+def _num(value) -> Optional[float]:
+    """numpy 값 -> JSON 값 (NaN은 null)"""
+    value = float(value)
+    return None if np.isnan(value) else round(value, 4)
+
+
+def _split_sigungu(district: str, gu_names: List[str]) -> Tuple[str, ...]:
+    """선거구 이름에 포함된 시군구 ('중구성동구갑' -> ('중구', '성동구'))"""
+    result = []
+    rest = district
+    matched = True
+    while matched:
+        matched = False
+        for gu in gu_names:
+            if rest.startswith(gu):
+                result.append(gu)
+                rest = rest[len(gu):]
+                matched = True
+                break
+    return tuple(result)
+
+
+class _DistrictResult:
+    """원본 레코드를 선거구 단위로 모은 중간 결과"""
+    __slots__ = ("winners", "votes", "electorate", "total_votes")
+
+    def __init__(self):
+        self.winners: List[Tuple[str, str]] = []
+        self.votes: Dict[str, float] = {}
+        self.electorate: Optional[float] = None
+        self.total_votes: Optional[float] = None
+
+
+def _collect(record: Dict[str, Any], result: _DistrictResult):
+    """선거 레코드 1건 (winner/candidates 형식 또는 현직 정치인 형식) 반영"""
+    winner = record.get('winner') if isinstance(record.get('winner'), dict) else record
+    if winner.get('name'):
+        result.winners.append((_clean_name(winner.get('name', '')), winner.get('party', '') or ''))
+
+    for candidate in record.get('candidates') or []:
+        if not isinstance(candidate, dict):
+            continue
+        votes = candidate.get('voteCount', candidate.get('votes'))
+        if votes is not None:
+            party = candidate.get('party', '') or ''
+            result.votes[party] = result.votes.get(party, 0.0) + float(votes)
+
+    if not record.get('candidates') and record.get('voteCount') is not None and winner.get('party') is not None:
+        party = winner.get('party', '') or ''
+        result.votes[party] = result.votes.get(party, 0.0) + float(record['voteCount'])
+
+    for key in ('electorate', 'electorateCount'):
+        if record.get(key) is not None:
+            result.electorate = float(record[key])
+    if record.get('totalVotes') is not None:
+        result.total_votes = float(record['totalVotes'])
+
+
+class ElectionTable:
+    """단일 선거(유형+연도)의 선거구 x 정당 배열"""
+
+    def __init__(self, election_type: str, year: str, districts: List[str],
+                 sigungu: List[Tuple[str, ...]], results: List[_DistrictResult],
+                 party_index: Dict[str, int]):
+        self.election_type = election_type
+        self.year = year
+        self.districts = districts
+        self.district_index = {name: i for i, name in enumerate(districts)}
+        self.sigungu = sigungu
+        self.winners = [r.winners for r in results]
+
+        n_districts, n_parties = len(districts), len(party_index)
+        self.seats = np.zeros((n_districts, n_parties), dtype=np.int16)
+        self.votes = np.full((n_districts, n_parties), np.nan)
+        self.electorate = np.full(n_districts, np.nan)
+        declared_total = np.full(n_districts, np.nan)
+        for d, result in enumerate(results):
+            for _, party in result.winners:
+                self.seats[d, party_index[party]] += 1
+            if result.votes:
+                self.votes[d, :] = 0.0
+                for party, votes in result.votes.items():
+                    self.votes[d, party_index[party]] = votes
+            if result.electorate is not None:
+                self.electorate[d] = result.electorate
+            if result.total_votes is not None:
+                declared_total[d] = result.total_votes
+
+        has_votes = ~np.isnan(self.votes).all(axis=1)
+        summed = np.where(has_votes, np.nansum(self.votes, axis=1), np.nan)
+        self.total_votes = np.where(np.isnan(declared_total), summed, declared_total)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.vote_share = self.votes / self.total_votes[:, None]
+            self.turnout = self.total_votes / self.electorate
+
+        # 표차: 1위 - 2위 득표율 (후보 2명 이상일 때)
+        ranked = -np.sort(-np.nan_to_num(self.vote_share, nan=-1.0), axis=1)
+        if n_parties >= 2:
+            candidates = (~np.isnan(self.vote_share)).sum(axis=1)
+            self.margin = np.where(candidates >= 2, ranked[:, 0] - ranked[:, 1], np.nan)
+        else:
+            self.margin = np.full(n_districts, np.nan)
+
+        # 당선 정당: 의석 최다. 의석이 같으면 득표율로 가리고, 득표 자료가 없거나 득표율도 같으면 -1 (미정)
+        top = self.seats.max(axis=1)
+        leaders = (self.seats == top[:, None]) & (top[:, None] > 0)
+        n_leaders = leaders.sum(axis=1)
+        leader_share = np.where(leaders, np.nan_to_num(self.vote_share, nan=-1.0), -2.0)
+        best_share = leader_share.max(axis=1)
+        share_known = ~(leaders & np.isnan(self.vote_share)).any(axis=1)
+        resolved = (n_leaders > 1) & share_known & ((leader_share == best_share[:, None]).sum(axis=1) == 1)
+        self.winner_party = np.where(
+            n_leaders == 1,
+            np.argmax(leaders, axis=1),
+            np.where(resolved, np.argmax(leader_share, axis=1), -1),
+        )
+
+        # 접전 순위 (표차 오름차순, 표차 없는 선거구 제외)
+        finite = np.flatnonzero(~np.isnan(self.margin))
+        self.closest_order = finite[np.argsort(self.margin[finite], kind='stable')]
+
+        # 직전 선거 대비 (link_previous에서 채움)
+        self.previous: Optional["ElectionTable"] = None
+        self.previous_row = np.full(n_districts, -1, dtype=np.int32)
+        self.share_swing = np.full((n_districts, n_parties), np.nan)
+        self.flipped = np.zeros(n_districts, dtype=bool)
+        self.flip_known = np.zeros(n_districts, dtype=bool)  # 두 선거 모두 당선 정당이 정해진 경우만
+
+        self.sigungu_rollup: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def has_vote_data(self) -> bool:
+        return bool((~np.isnan(self.total_votes)).any())
+
+    def link_previous(self, previous: "ElectionTable"):
+        """같은 이름의 선거구끼리 직전 선거와 비교 (스윙, 정당 교체)"""
+        self.previous = previous
+        rows = np.array([previous.district_index.get(name, -1) for name in self.districts], dtype=np.int32)
+        self.previous_row = rows
+        matched = np.flatnonzero(rows >= 0)
+        if matched.size:
+            self.share_swing[matched] = self.vote_share[matched] - previous.vote_share[rows[matched]]
+            current_winner = self.winner_party[matched]
+            previous_winner = previous.winner_party[rows[matched]]
+            self.flip_known[matched] = (current_winner >= 0) & (previous_winner >= 0)
+            self.flipped[matched] = self.flip_known[matched] & (current_winner != previous_winner)
+
+    def build_rollup(self, parties: List[str]):
+        """시군구별 정당 의석/득표 집계 (선거구가 여러 시군구에 걸치면 각 시군구에 포함)"""
+        sigungu_names = sorted({gu for names in self.sigungu for gu in names})
+        if not sigungu_names:
+            return
+        gu_index = {gu: i for i, gu in enumerate(sigungu_names)}
+        membership = np.zeros((len(sigungu_names), len(self.districts)), dtype=np.int16)
+        for d, names in enumerate(self.sigungu):
+            for gu in names:
+                membership[gu_index[gu], d] = 1
+
+        seats = membership @ self.seats
+        votes = membership @ np.nan_to_num(self.votes, nan=0.0)
+        districts = membership.sum(axis=1)
+        flips = membership @ self.flipped.astype(np.int16)
+        for gu, s in gu_index.items():
+            party_seats = {parties[p]: int(seats[s, p]) for p in np.flatnonzero(seats[s])}
+            party_votes = {parties[p]: float(votes[s, p]) for p in np.flatnonzero(votes[s])}
+            total_votes = sum(party_votes.values())
+            self.sigungu_rollup[gu] = {
+                "sigungu": gu,
+                "districts": int(districts[s]),
+                "seats": party_seats,
+                "votes": party_votes,
+                "vote_share": {p: round(v / total_votes, 4) for p, v in party_votes.items()} if total_votes else {},
+                "flipped_districts": int(flips[s]),
+                "leading_party": self._leading_party(seats[s], votes[s], parties),
+            }
+
+    @staticmethod
+    def _leading_party(seats: np.ndarray, votes: np.ndarray, parties: List[str]) -> Optional[str]:
+        """의석 최다 정당 (의석이 같으면 득표 최다, 득표 자료가 없거나 같으면 None)"""
+        if not seats.any():
+            return None
+        leaders = np.flatnonzero(seats == seats.max())
+        if leaders.size > 1:
+            leader_votes = votes[leaders]
+            if not (leader_votes > 0).all() or (leader_votes == leader_votes.max()).sum() > 1:
+                return None
+            leaders = leaders[[int(np.argmax(leader_votes))]]
+        return parties[int(leaders[0])]
+
+    def district_row(self, d: int, parties: List[str]) -> Dict[str, Any]:
+        """선거구 1개 결과 (배열에서 조립)"""
+        share = self.vote_share[d]
+        share_parties = np.flatnonzero(~np.isnan(share))
+        swing = self.share_swing[d]
+        swing_parties = np.flatnonzero(~np.isnan(swing))
+        previous_row = int(self.previous_row[d])
+        winner_party = int(self.winner_party[d])
+        return {
+            "district": self.districts[d],
+            "sigungu": list(self.sigungu[d]),
+            "winners": [{"name": name, "party": party} for name, party in self.winners[d]],
+            "winner_party": parties[winner_party] if winner_party >= 0 else None,
+            "seats": {parties[p]: int(self.seats[d, p]) for p in np.flatnonzero(self.seats[d])},
+            "vote_share": {parties[p]: _num(share[p]) for p in share_parties},
+            "total_votes": _num(self.total_votes[d]),
+            "turnout": _num(self.turnout[d]),
+            "margin": _num(self.margin[d]),
+            "swing": {
+                "previous_year": self.previous.year if self.previous is not None and previous_row >= 0 else None,
+                "previous_winner_party": (
+                    parties[int(self.previous.winner_party[previous_row])]
+                    if previous_row >= 0 and self.previous.winner_party[previous_row] >= 0 else None
+                ),
+                "flipped": bool(self.flipped[d]) if self.flip_known[d] else None,
+                "share_change": {parties[p]: _num(swing[p]) for p in swing_parties},
+            },
+        }
+
+
+class ElectionAnalytics:
+    """전체 선거 결과 + 읍면동 연결"""
+
+    def __init__(self):
+        self.parties: List[str] = []
+        self.party_index: Dict[str, int] = {}
+        self.tables: Dict[str, Dict[str, ElectionTable]] = {}
+        self.emdong_codes: List[str] = []
+        self.emdong_index: Dict[str, int] = {}
+        self.emdong_info: List[Dict[str, str]] = []
+        # (유형, 연도) -> 읍면동별 선거구 행 번호 (-1: 없음)
+        self.emdong_rows: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def party(self, name: str) -> int:
+        if name not in self.party_index:
+            self.party_index[name] = len(self.parties)
+            self.parties.append(name)
+        return self.party_index[name]
+
+    def table(self, election_type: str, year: str) -> Optional[ElectionTable]:
+        return self.tables.get(election_type, {}).get(year)
+
+    def years(self, election_type: str) -> List[str]:
+        return sorted(self.tables.get(election_type, {}).keys())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "types": {
+                election_type: {
+                    "name": ELECTION_TYPES[election_type],
+                    "years": self.years(election_type),
+                    "districts": {year: len(t.districts) for year, t in sorted(tables.items())},
+                    "vote_data": {year: t.has_vote_data for year, t in sorted(tables.items())},
+                }
+                for election_type, tables in self.tables.items()
+            },
+            "parties": self.parties,
+            "emdong_count": len(self.emdong_codes),
+        }
+
+    def closest(self, table: ElectionTable, k: int) -> List[Dict[str, Any]]:
+        return [
+            {"rank": rank + 1, **table.district_row(int(d), self.parties)}
+            for rank, d in enumerate(table.closest_order[:k])
+        ]
+
+    def emdong_results(self, emdong_code: str) -> Optional[Dict[str, Any]]:
+        e = self.emdong_index.get(emdong_code)
+        if e is None:
+            return None
+        results: Dict[str, Dict[str, Any]] = {}
+        for (election_type, year), rows in sorted(self.emdong_rows.items()):
+            row = int(rows[e])
+            if row >= 0:
+                table = self.tables[election_type][year]
+                results.setdefault(election_type, {})[year] = table.district_row(row, self.parties)
+        return {**self.emdong_info[e], "elections": results}
+
+
+def _gather_records(complete: Dict[str, Any], real: Dict[str, Any]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """유형 -> 연도 -> 레코드 목록"""
+    gathered: Dict[str, Dict[str, List[Dict[str, Any]]]] = {t: {} for t in ELECTION_TYPES}
+
+    def flatten(value) -> List[Dict[str, Any]]:
+        if isinstance(value, list):
+            return [v for v in value if isinstance(v, dict)]
+        if isinstance(value, dict):
+            if 'name' in value or 'winner' in value:
+                return [value]
+            return [r for v in value.values() for r in flatten(v)]
+        return []
+
+    for election_type in ELECTION_TYPES:
+        for year, value in (complete.get(election_type) or {}).items():
+            gathered[election_type][str(year)] = flatten(value)
+        real_year = REAL_ELECTION_YEARS[election_type]
+        if real.get(election_type) and real_year not in gathered[election_type]:
+            gathered[election_type][real_year] = flatten(real[election_type])
+    return gathered
+
+
+def build_election_analytics(complete: Dict[str, Any], real: Dict[str, Any],
+                             mapping: Dict[str, Any], stats_regions: Dict[str, Any]) -> ElectionAnalytics:
+    """선거 데이터 + 동 매핑 + 읍면동 통계로 분석 배열 구성"""
+    start = time.time()
+    analytics = ElectionAnalytics()
+
+    seoul_emdongs = [
+        (code, info) for code, info in sorted(stats_regions.items())
+        if info.get('sido_code') == SEOUL_SIDO_CODE
+    ]
+    gu_names = sorted({info.get('sigungu_name', '') for _, info in seoul_emdongs if info.get('sigungu_name')},
+                      key=len, reverse=True)
+
+    # 1) 선거구 단위로 모으고 정당 목록 확정
+    gathered = _gather_records(complete, real)
+    per_table: Dict[Tuple[str, str], Dict[str, _DistrictResult]] = {}
+    for election_type, by_year in gathered.items():
+        for year, records in by_year.items():
+            districts: Dict[str, _DistrictResult] = {}
+            for record in records:
+                district = (record.get('winner') or {}).get('district') or record.get('district') or SEOUL_DISTRICT
+                if election_type == "mayor":
+                    district = SEOUL_DISTRICT
+                _collect(record, districts.setdefault(district, _DistrictResult()))
+            for result in districts.values():
+                for _, party in result.winners:
+                    analytics.party(party)
+                for party in result.votes:
+                    analytics.party(party)
+            if districts:
+                per_table[(election_type, year)] = districts
+
+    # 2) 배열 구성
+    for (election_type, year), districts in per_table.items():
+        names = list(districts.keys())
+        sigungu = [_split_sigungu(name, gu_names) for name in names]
+        table = ElectionTable(election_type, year, names, sigungu,
+                              [districts[n] for n in names], analytics.party_index)
+        analytics.tables.setdefault(election_type, {})[year] = table
+
+    # 3) 직전 선거 연결, 시군구 집계
+    for election_type in analytics.tables:
+        previous = None
+        for year in analytics.years(election_type):
+            table = analytics.tables[election_type][year]
+            if previous is not None:
+                table.link_previous(previous)
+            table.build_rollup(analytics.parties)
+            previous = table
+
+    # 4) 읍면동 -> 선거구
+    mapping_by_dong = {_normalize_dong(name): info for name, info in mapping.items() if isinstance(info, dict)}
+    for code, info in seoul_emdongs:
+        analytics.emdong_index[code] = len(analytics.emdong_codes)
+        analytics.emdong_codes.append(code)
+        analytics.emdong_info.append({
+            "emdong_code": code,
+            "emdong_name": info.get('emdong_name', ''),
+            "sigungu_name": info.get('sigungu_name', ''),
+        })
+
+    for election_type, by_year in analytics.tables.items():
+        for year, table in by_year.items():
+            rows = np.full(len(analytics.emdong_codes), -1, dtype=np.int32)
+            # 시군구에 선거구가 하나뿐이면 매핑 없이도 연결
+            single_district: Dict[str, int] = {}
+            district_count: Dict[str, int] = {}
+            for d, names in enumerate(table.sigungu):
+                for gu in names:
+                    district_count[gu] = district_count.get(gu, 0) + 1
+                    single_district[gu] = d
+            for e, emdong in enumerate(analytics.emdong_info):
+                gu = emdong["sigungu_name"]
+                if election_type == "mayor":
+                    rows[e] = 0
+                    continue
+                dong_mapping = mapping_by_dong.get(_normalize_dong(emdong["emdong_name"]), {})
+                district = dong_mapping.get(MAPPING_KEYS[election_type], '')
+                row = table.district_index.get(district, -1)
+                if row >= 0 and gu not in table.sigungu[row]:
+                    row = -1  # 다른 구의 같은 이름 동
+                if row < 0 and district_count.get(gu) == 1:
+                    row = single_district[gu]
+                rows[e] = row
+            analytics.emdong_rows[(election_type, year)] = rows
+
+    print(
+        f"✅ 선거 분석 구성 완료: {sum(len(t) for t in analytics.tables.values())}개 선거, "
+        f"{len(analytics.parties)}개 정당, {len(analytics.emdong_codes)}개 읍면동 ({time.time() - start:.2f}초)"
+    )
+    return analytics
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+읽기 전용 데이터 구조
+
+캐시된 JSON 데이터는 여러 요청/스레드가 함께 쓰므로 핸들러가 수정하지 못하도록
+FrozenDict / FrozenList 로 감싼다. dict / list 의 하위 클래스라서 기존 isinstance 검사,
+json 인코딩, FastAPI 응답 변환은 그대로 동작하고, 수정 메서드만 막힌다.
+
+요청별로 값을 바꿔야 하면 overlay()로 최상위만 새로 만든 읽기 전용 사본을 쓴다
+(하위 구조는 원본과 공유하므로 깊은 복사가 필요 없다).
+"""
+
+from typing import Any, Dict
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("읽기 전용 데이터는 수정할 수 없습니다 (overlay()를 사용하세요)")
+
+
+class FrozenDict(dict):
+    """수정할 수 없는 dict"""
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __reduce__(self):
+        # 프로세스 간 전달(pickle), copy 지원
+        return (FrozenDict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """수정할 수 없는 list"""
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    clear = _read_only
+    sort = _read_only
+    reverse = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """중첩된 dict/list를 읽기 전용 구조로 변환 (이미 읽기 전용이면 그대로)"""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def overlay(base: Dict[str, Any], changes: Dict[str, Any] = None, **kwargs) -> FrozenDict:
+    """base 위에 changes를 덮어쓴 읽기 전용 dict (base는 수정하지 않음)"""
+    merged = dict(base)
+    if changes:
+        merged.update(changes)
+    merged.update(kwargs)
+    return FrozenDict((k, freeze(v)) for k, v in merged.items())
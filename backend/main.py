@@ -1,21 +1,48 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import Dict, List, Any, Optional
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from typing import Dict, List, Any, Literal, Optional
 from collections import defaultdict
+import hmac
 import json
 import os
+import threading
+import time
 from pathlib import Path
 
+from admission import AdmissionController, AdmissionControlMiddleware, RoutePolicy
+from article_store import ArticleStore, build_article_store
+from frozen import freeze, overlay
+from election_analytics import ELECTION_TYPES, ElectionAnalytics, build_election_analytics
+from region_rankings import RegionRankings, build_region_rankings
+from serialization import (AssemblyMember, AssemblyMemberListResponse, EmdongListResponse, EmdongSummary,
+                           FastJSONResponse, encode_json)
+from seoul_region_view import VIEW_SOURCES, SeoulRegionView, build_seoul_region_view, data_version
+from timeseries_analytics import MEASURES, TIMESERIES_METRICS, TimeseriesAnalytics, build_timeseries_analytics
+from news_ingest import NewsLog, NewsIngestConsumer, validate_record
+from warmup import WARMUP_WORKERS, WarmupScheduler
+
 app = FastAPI(
     title="InsightForge API",
     description="지역 통계 및 정치인 분석 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
+# 비싼 경로: 같은 요청 병합 + 동시 처리 제한 (대기열 초과 429, 대기 기한 초과 503)
+# CORS보다 먼저 등록해야 거부 응답에도 CORS 헤더가 붙는다
+admission = AdmissionController([
+    RoutePolicy("politicians_emdong", r"^/api/politicians/emdong/[^/]+$",
+                max_concurrency=4, max_queue=512, queue_timeout=2.0),
+    RoutePolicy("search", r"^/api/search$", max_concurrency=4, max_queue=128, queue_timeout=1.0),
+    RoutePolicy("network_assembly", r"^/api/network/assembly$", max_concurrency=2, max_queue=256, queue_timeout=2.0),
+])
+app.add_middleware(AdmissionControlMiddleware, controller=admission)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -33,12 +60,29 @@ else:
 
 print(f"📁 데이터 디렉토리: {DATA_DIR}")
 
-# 데이터 캐시
+# 뉴스 증분 적재 로그 디렉토리 (data가 읽기 전용으로 마운트된 경우 별도 지정)
+NEWS_LOG_DIR = Path(os.environ.get("NEWS_LOG_DIR", str(DATA_DIR / "news_log")))
+# 뉴스 적재 API 공유 토큰 (X-Ingest-Token 헤더, 비어 있으면 적재 API 비활성화)
+NEWS_INGEST_TOKEN = os.environ.get("NEWS_INGEST_TOKEN", "")
+
+# 데이터 캐시 (읽기 전용: 요청별 변경은 overlay() 사용)
 data_cache: Dict[str, Any] = {}
 aggregated_cache: Dict[str, Any] = {}  # 집계된 데이터 캐시
+derived_cache: Dict[str, Any] = {}  # 원본 데이터에서 파생된 응답 캐시
+article_store: Optional[ArticleStore] = None  # 뉴스 기사 통합 저장소
+article_store_lock = threading.RLock()
+election_analytics: Optional[ElectionAnalytics] = None  # 선거 결과 분석 배열
+region_rankings: Optional[RegionRankings] = None  # 지역 지표 순위 색인
+timeseries_analytics: Optional[TimeseriesAnalytics] = None  # 연도 x 읍면동 변화 분석
+seoul_region_view: Optional[SeoulRegionView] = None  # 서울 지역 materialized view
+seoul_region_view_checked = 0.0
+seoul_region_view_lock = threading.Lock()
+
+# 데이터 버전(파일 수정 시각) 확인 주기 (초)
+DATA_VERSION_CHECK_INTERVAL = 5.0
 
 def load_json_file(filename: str) -> Any:
-    """JSON 파일 로드 및 캐싱"""
+    """JSON 파일 로드 및 캐싱 (읽기 전용 FrozenDict/FrozenList로 반환)"""
     if filename in data_cache:
         return data_cache[filename]
     
@@ -48,12 +92,170 @@ def load_json_file(filename: str) -> Any:
     
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = freeze(json.load(f))
             data_cache[filename] = data
             return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 로드 실패: {str(e)}")
 
+def load_json_files(*filenames: str):
+    """여러 JSON 파일 로드 (예열용)"""
+    for filename in filenames:
+        load_json_file(filename)
+
+def get_derived(key: str, builder) -> Any:
+    """원본 데이터에서 파생된 결과 캐싱 (읽기 전용으로 고정해 요청/스레드 간 공유)"""
+    if key not in derived_cache:
+        derived_cache[key] = freeze(builder())
+    return derived_cache[key]
+
+def get_article_store() -> ArticleStore:
+    """뉴스 기사 저장소 (최초 접근 시 구성)"""
+    global article_store
+    if article_store is None:
+        with article_store_lock:
+            if article_store is None:
+                try:
+                    article_store = build_article_store(DATA_DIR)
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=f"기사 저장소 구성 실패: {str(e)}")
+                # 증분 적재 로그 재생 (실패해도 저장소는 쓸 수 있고, 소비자 스레드가 다시 시도한다)
+                try:
+                    news_consumer.poll()
+                except Exception as e:
+                    news_consumer.last_error = str(e)
+                    print(f"❌ 뉴스 로그 재생 실패: {e}")
+    return article_store
+
+def get_election_analytics() -> ElectionAnalytics:
+    """선거 결과 분석 (최초 접근 시 구성)"""
+    global election_analytics
+    if election_analytics is None:
+        complete = load_json_file("previous_election_data_complete.json")
+        real = load_json_file("real_election_data.json")
+        mapping = load_json_file("dong_election_mapping_complete.json")
+        stats_data = load_json_file("sgis_comprehensive_stats.json")
+        try:
+            election_analytics = build_election_analytics(complete, real, mapping, stats_data.get('regions', {}))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"선거 분석 구성 실패: {str(e)}")
+    return election_analytics
+
+def get_region_rankings() -> RegionRankings:
+    """지역 지표 순위 색인 (최초 접근 시 구성)"""
+    global region_rankings
+    if region_rankings is None:
+        if "sigungu" not in aggregated_cache:
+            aggregate_data_on_startup()
+        national_regions = load_json_file("sgis_national_regions.json")
+        stats_data = load_json_file("sgis_comprehensive_stats.json")
+        enhanced_2023 = load_enhanced_2023()
+        
+        emdong_rows = []
+        for emdong_cd, emdong_stats in stats_data.get('regions', {}).items():
+            emdong_rows.append({
+                **summarize_emdong(emdong_cd, emdong_stats, enhanced_2023),
+                "sido_code": emdong_stats.get('sido_code', ''),
+                "sido_name": emdong_stats.get('sido_name', ''),
+                "sigungu_code": emdong_stats.get('sigungu_code', ''),
+                "sigungu_name": emdong_stats.get('sigungu_name', '')
+            })
+        
+        sido_names = {}
+        sigungu_rows = []
+        sigungu_cache = aggregated_cache.get("sigungu", {})
+        for sido_cd, sido_info in national_regions.get('regions', {}).items():
+            sido_names[sido_cd] = sido_info.get('sido_name', '')
+            for sigungu_item in sido_info.get('sigungu_list', []):
+                sigungu_cd = sigungu_item['sigungu_code']
+                sigungu_rows.append({
+                    "code": sigungu_cd,
+                    "name": sigungu_item.get('sigungu_name', ''),
+                    "sido_code": sido_cd,
+                    "sido_name": sido_names[sido_cd],
+                    **sigungu_cache.get(sigungu_cd, {})
+                })
+        
+        region_rankings = build_region_rankings(emdong_rows, sigungu_rows, sido_names)
+    return region_rankings
+
+def get_timeseries_analytics() -> TimeseriesAnalytics:
+    """다년도 변화 분석 (최초 접근 시 구성)"""
+    global timeseries_analytics
+    if timeseries_analytics is None:
+        multiyear_data = load_json_file("sgis_multiyear_stats.json")
+        try:
+            enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
+            enhanced_by_year = enhanced_data.get('regions_by_year', {})
+        except:
+            enhanced_by_year = {}
+        stats_data = load_json_file("sgis_comprehensive_stats.json")
+        
+        labels = {
+            emdong_cd: {
+                "code": emdong_cd,
+                "name": emdong_stats.get('emdong_name', ''),
+                "sido_name": emdong_stats.get('sido_name', ''),
+                "sigungu_name": emdong_stats.get('sigungu_name', '')
+            }
+            for emdong_cd, emdong_stats in stats_data.get('regions', {}).items()
+        }
+        timeseries_analytics = build_timeseries_analytics(
+            multiyear_data.get('regions_by_year', {}), enhanced_by_year, labels
+        )
+    return timeseries_analytics
+
+def get_seoul_region_view() -> SeoulRegionView:
+    """서울 지역 뷰 (데이터 버전이 바뀌면 다시 구성)"""
+    global seoul_region_view, seoul_region_view_checked
+    now = time.time()
+    if seoul_region_view is not None and now - seoul_region_view_checked < DATA_VERSION_CHECK_INTERVAL:
+        return seoul_region_view
+    
+    with seoul_region_view_lock:
+        version = data_version(DATA_DIR, VIEW_SOURCES)
+        if seoul_region_view is None or seoul_region_view.version != version:
+            try:
+                seoul_region_view = build_seoul_region_view(DATA_DIR, version)
+            except FileNotFoundError:
+                raise HTTPException(status_code=404, detail="seoul_comprehensive_data.json 파일을 찾을 수 없습니다")
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"파일 로드 실패: {str(e)}")
+        seoul_region_view_checked = now
+    return seoul_region_view
+
+news_log = NewsLog(NEWS_LOG_DIR)
+news_consumer = NewsIngestConsumer(news_log, get_article_store)
+
+# 데이터 예열 작업 (우선순위 숫자가 작을수록 먼저, 의존 작업이 끝난 뒤 시작)
+warmup = WarmupScheduler(int(os.environ.get("WARMUP_WORKERS", WARMUP_WORKERS)))
+warmup.add("sgis_stats", lambda: load_json_files("sgis_national_regions.json", "sgis_comprehensive_stats.json"),
+           priority=0, required=True)
+warmup.add("multiyear_stats", lambda: load_json_files("sgis_multiyear_stats.json"), priority=0)
+warmup.add("enhanced_stats", lambda: load_json_files("sgis_enhanced_multiyear_stats.json"), priority=0)
+warmup.add("politician_data", lambda: load_json_files(
+    "assembly_by_region.json", "dong_election_mapping_complete.json", "national_assembly_22nd_real.json",
+    "seoul_mayor_8th_real.json", "seoul_gu_mayor_8th.json", "seoul_si_uiwon_8th_real.json",
+    "seoul_gu_uiwon_8th_real.json"), priority=0, required=True)
+warmup.add("national_aggregate", lambda: aggregate_data_on_startup(), priority=1,
+           depends=["sgis_stats"], required=True)
+warmup.add("emdong_lists", lambda: get_derived("emdong_lists", build_emdong_lists), priority=1,
+           depends=["sgis_stats", "enhanced_stats"], required=True)
+warmup.add("assembly_members", lambda: get_derived("assembly_members", build_assembly_member_list), priority=1,
+           depends=["politician_data"], required=True)
+warmup.add("article_store", lambda: get_article_store(), priority=1)
+warmup.add("election_data", lambda: load_json_files("previous_election_data_complete.json", "real_election_data.json"),
+           priority=2)
+warmup.add("election_analytics", lambda: get_election_analytics(), priority=2,
+           depends=["sgis_stats", "politician_data", "election_data"])
+warmup.add("region_rankings", lambda: get_region_rankings(), priority=2,
+           depends=["national_aggregate", "enhanced_stats"])
+warmup.add("timeseries_analytics", lambda: get_timeseries_analytics(), priority=3,
+           depends=["sgis_stats", "multiyear_stats", "enhanced_stats"])
+warmup.add("seoul_region_view", lambda: get_seoul_region_view(), priority=3)
+warmup.add("network_graph", lambda: load_json_files("assembly_network_graph.json"), priority=4)
+warmup.add("local_lda", lambda: load_json_files("local_politicians_lda_analysis.json"), priority=4)
+
 # ============================================
 # 기본 엔드포인트
 # ============================================
@@ -75,8 +277,20 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크"""
-    return {"status": "healthy"}
+    """헬스 체크 (데이터셋별 예열 상태, 소요 시간, 오류)"""
+    return warmup.status()
+
+@app.get("/api/admission/status")
+async def get_admission_status():
+    """요청 병합/동시 처리 제한 상태 (경로별 요청, 병합, 거부 수와 응답 시간)"""
+    return admission.stats()
+
+@app.get("/ready")
+async def ready_check():
+    """준비 상태 프로브 (데이터 예열이 끝나야 200, 그 전이나 필수 데이터가 없거나 실패하면 503)"""
+    if warmup.ready:
+        return {"ready": True}
+    return FastJSONResponse({"ready": False, "waiting": warmup.not_ready()}, status_code=503)
 
 # ============================================
 # 지역 데이터 API
@@ -140,8 +354,8 @@ def aggregate_data_on_startup():
                 sigungu_aggregated[sigungu_cd]["total_worker"] += worker
                 sigungu_aggregated[sigungu_cd]["emdong_count"] += 1
         
-        aggregated_cache["sido"] = sido_aggregated
-        aggregated_cache["sigungu"] = dict(sigungu_aggregated)
+        aggregated_cache["sido"] = freeze(sido_aggregated)
+        aggregated_cache["sigungu"] = freeze(dict(sigungu_aggregated))
         aggregated_cache["commercial"] = commercial_data.get('regions', {})
         aggregated_cache["tech"] = tech_data
         
@@ -150,12 +364,14 @@ def aggregate_data_on_startup():
         print(f"✅ 기술업종 데이터: {len(tech_data.get('sigungu', {}))}개 시군구")
         
     except Exception as e:
-        print(f"❌ 데이터 집계 실패: {e}")
+        print(f"❌ 데이터 집계 실패: {getattr(e, 'detail', None) or e}")
+        raise
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 실행"""
-    aggregate_data_on_startup()
+    """앱 시작 시 실행 (데이터 예열은 백그라운드에서 진행, /ready로 완료 확인)"""
+    warmup.start()
+    news_consumer.start()
 
 @app.get("/api/national/sido")
 async def get_sido_list():
@@ -224,6 +440,10 @@ async def get_sigungu_list(sido_code: str):
 async def get_sigungu_detail(sigungu_code: str):
     """시군구 상세 정보 (상권 + 기술업종)"""
     try:
+        # 예열(national_aggregate)이 끝나기 전에 요청이 오면 직접 집계
+        if "commercial" not in aggregated_cache:
+            aggregate_data_on_startup()
+        
         commercial_cache = aggregated_cache.get("commercial", {})
         tech_cache = aggregated_cache.get("tech", {})
         
@@ -238,60 +458,73 @@ async def get_sigungu_detail(sigungu_code: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/national/sigungu/{sigungu_code}")
+def load_enhanced_2023() -> Dict[str, Any]:
+    """연령별 상세 데이터 2023년 (정확한 인구), 없으면 빈 dict"""
+    try:
+        enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
+        return enhanced_data.get('regions_by_year', {}).get('2023', {})
+    except:
+        return {}
+
+def summarize_emdong(emdong_cd: str, emdong_stats: Dict[str, Any], enhanced_2023: Dict[str, Any]) -> Dict[str, Any]:
+    """읍면동 목록 항목 (인구/가구/주택/사업체 지표)"""
+    # 연령별 데이터에서 정확한 인구 가져오기
+    enhanced = enhanced_2023.get(emdong_cd, {})
+    accurate_pop = enhanced.get('basic', {}).get('total_population', 0)
+    
+    # 정확한 인구가 있으면 사용
+    if accurate_pop > 0:
+        population = accurate_pop
+        avg_size = emdong_stats.get('household', {}).get('avg_family_member_cnt', 2.0)
+        household_cnt = round(population / avg_size)
+    else:
+        population = emdong_stats.get('household', {}).get('family_member_cnt', 0)
+        household_cnt = emdong_stats.get('household', {}).get('household_cnt', 0)
+    
+    return {
+        "code": emdong_cd,
+        "name": emdong_stats.get('emdong_name', ''),
+        "full_address": emdong_stats.get('full_address', ''),
+        "household_cnt": household_cnt,
+        "population": population,
+        "avg_family_size": emdong_stats.get('household', {}).get('avg_family_member_cnt', 0),
+        "house_cnt": emdong_stats.get('house', {}).get('house_cnt', 0),
+        "company_cnt": emdong_stats.get('company', {}).get('corp_cnt', 0),
+        "worker_cnt": emdong_stats.get('company', {}).get('tot_worker', 0),
+        "x_coord": emdong_stats.get('x_coord', ''),
+        "y_coord": emdong_stats.get('y_coord', '')
+    }
+
+def build_emdong_lists() -> Dict[str, EmdongListResponse]:
+    """시군구 코드 -> 읍면동 목록 응답 구조체 (통계 포함)"""
+    stats_data = load_json_file("sgis_comprehensive_stats.json")
+    stats_regions = stats_data.get('regions', {})
+    
+    # 연령별 상세 데이터 로드 (정확한 인구)
+    enhanced_2023 = load_enhanced_2023()
+    
+    emdong_lists: Dict[str, List[EmdongSummary]] = defaultdict(list)
+    sigungu_names: Dict[str, str] = {}
+    for emdong_cd, emdong_stats in stats_regions.items():
+        sigungu_cd = emdong_stats.get('sigungu_code')
+        if not sigungu_names.get(sigungu_cd):
+            sigungu_names[sigungu_cd] = emdong_stats.get('sigungu_name', '')
+        emdong_lists[sigungu_cd].append(EmdongSummary(**summarize_emdong(emdong_cd, emdong_stats, enhanced_2023)))
+    
+    return {
+        sigungu_cd: EmdongListResponse(sigungu_cd, sigungu_names[sigungu_cd], emdong_list, len(emdong_list))
+        for sigungu_cd, emdong_list in emdong_lists.items()
+    }
+
+@app.get("/api/national/sigungu/{sigungu_code}", response_model=EmdongListResponse)
 async def get_emdong_list(sigungu_code: str):
     """특정 시군구의 읍면동 목록 (통계 포함)"""
     try:
-        stats_data = load_json_file("sgis_comprehensive_stats.json")
-        stats_regions = stats_data.get('regions', {})
-        
-        # 연령별 상세 데이터 로드 (정확한 인구)
-        try:
-            enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
-            enhanced_2023 = enhanced_data.get('regions_by_year', {}).get('2023', {})
-        except:
-            enhanced_2023 = {}
-        
-        emdong_list = []
-        sigungu_name = None
-        for emdong_cd, emdong_stats in stats_regions.items():
-            if emdong_stats.get('sigungu_code') == sigungu_code:
-                if not sigungu_name:
-                    sigungu_name = emdong_stats.get('sigungu_name', '')
-                
-                # 연령별 데이터에서 정확한 인구 가져오기
-                enhanced = enhanced_2023.get(emdong_cd, {})
-                accurate_pop = enhanced.get('basic', {}).get('total_population', 0)
-                
-                # 정확한 인구가 있으면 사용
-                if accurate_pop > 0:
-                    population = accurate_pop
-                    avg_size = emdong_stats.get('household', {}).get('avg_family_member_cnt', 2.0)
-                    household_cnt = round(population / avg_size)
-                else:
-                    population = emdong_stats.get('household', {}).get('family_member_cnt', 0)
-                    household_cnt = emdong_stats.get('household', {}).get('household_cnt', 0)
-                
-                emdong_list.append({
-                    "code": emdong_cd,
-                    "name": emdong_stats.get('emdong_name', ''),
-                    "full_address": emdong_stats.get('full_address', ''),
-                    "household_cnt": household_cnt,
-                    "population": population,
-                    "avg_family_size": emdong_stats.get('household', {}).get('avg_family_member_cnt', 0),
-                    "house_cnt": emdong_stats.get('house', {}).get('house_cnt', 0),
-                    "company_cnt": emdong_stats.get('company', {}).get('corp_cnt', 0),
-                    "worker_cnt": emdong_stats.get('company', {}).get('tot_worker', 0),
-                    "x_coord": emdong_stats.get('x_coord', ''),
-                    "y_coord": emdong_stats.get('y_coord', '')
-                })
-        
-        return {
-            "sigungu_code": sigungu_code,
-            "sigungu_name": sigungu_name,
-            "emdong_list": emdong_list,
-            "total": len(emdong_list)
-        }
+        emdong_lists = get_derived("emdong_lists", build_emdong_lists)
+        result = emdong_lists.get(sigungu_code) or EmdongListResponse(sigungu_code, None, [], 0)
+        return FastJSONResponse(result)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -333,28 +566,26 @@ async def get_emdong_detail(emdong_code: str, year: Optional[str] = "2023"):
         
         # 다년도 데이터 반환
         emdong_stats = year_data[emdong_code]
+        household = emdong_stats.get('household', {})
         
-        # 연령별 상세 데이터에서 정확한 인구 가져오기
+        # 연령별 상세 데이터에서 정확한 인구 가져오기 (캐시 원본은 그대로 두고 응답에만 반영)
         try:
             enhanced_data = load_json_file("sgis_enhanced_multiyear_stats.json")
             enhanced_year = enhanced_data.get('regions_by_year', {}).get(year, {})
             enhanced_emdong = enhanced_year.get(emdong_code, {})
             
             if enhanced_emdong and enhanced_emdong.get('basic'):
-                # 정확한 인구로 교체
+                # 정확한 인구로 교체, 가구수도 계산
                 accurate_pop = enhanced_emdong['basic']['total_population']
-                if not emdong_stats.get('household'):
-                    emdong_stats['household'] = {}
-                emdong_stats['household']['family_member_cnt'] = accurate_pop
-                # 가구수도 계산
-                avg_size = emdong_stats['household'].get('avg_family_member_cnt', 2.0)
-                emdong_stats['household']['household_cnt'] = round(accurate_pop / avg_size)
+                avg_size = household.get('avg_family_member_cnt', 2.0)
+                household = overlay(household, family_member_cnt=accurate_pop,
+                                    household_cnt=round(accurate_pop / avg_size))
         except:
             pass
         
         return {
             "code": emdong_code,
-            "household": emdong_stats.get('household', {}),
+            "household": household,
             "house": emdong_stats.get('house', {}),
             "company": emdong_stats.get('company', {}),
             "year": year
@@ -364,6 +595,57 @@ async def get_emdong_detail(emdong_code: str, year: Optional[str] = "2023"):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/national/emdong/{emdong_code}/percentiles")
+async def get_emdong_percentiles(emdong_code: str):
+    """읍면동 지표별 순위/백분위 (전국, 시도, 시군구 내)"""
+    try:
+        result = get_region_rankings().levels["emdong"].percentiles(emdong_code)
+        
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"{emdong_code} 읍면동을 찾을 수 없습니다")
+        
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/rank")
+async def get_rank(metric: str, scope: Optional[str] = "national", k: int = 20,
+                   level: Optional[str] = "emdong", order: Optional[str] = "desc"):
+    """지표별 상위 k개 지역 (scope: national / 시도 코드·이름 / 시군구 코드)"""
+    try:
+        rankings = get_region_rankings()
+        
+        if level not in rankings.levels:
+            raise HTTPException(status_code=400, detail="level은 emdong 또는 sigungu입니다")
+        ranking = rankings.levels[level]
+        
+        if metric not in ranking.metrics:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{metric} 지표를 지원하지 않습니다 (가능: {', '.join(ranking.metrics)})"
+            )
+        
+        scope_code = rankings.resolve_scope(scope)
+        if scope_code is None or (metric, scope_code) not in ranking.order:
+            raise HTTPException(status_code=404, detail=f"{scope} 범위를 찾을 수 없습니다")
+        
+        return {
+            "metric": metric,
+            "metric_name": ranking.metrics[metric],
+            "level": level,
+            "scope": scope_code,
+            "scope_name": rankings.scope_name(scope_code),
+            "order": "asc" if order == "asc" else "desc",
+            "items": ranking.top(metric, scope_code, max(k, 0), ascending=(order == "asc")),
+            "total": int(len(ranking.scopes[scope_code]))
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/years")
 async def get_available_years():
     """사용 가능한 연도 목록"""
@@ -430,8 +712,58 @@ async def get_emdong_enhanced(emdong_code: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/timeseries/movers")
+async def get_timeseries_movers(metric: str = "population", measure: str = "cagr",
+                                direction: Optional[str] = "growth", scope: Optional[str] = "national", k: int = 20):
+    """급성장/급감 읍면동 (direction: growth / decline)"""
+    try:
+        if metric not in TIMESERIES_METRICS:
+            raise HTTPException(status_code=400, detail=f"{metric} 지표를 지원하지 않습니다 (가능: {', '.join(TIMESERIES_METRICS)})")
+        if measure not in MEASURES:
+            raise HTTPException(status_code=400, detail=f"{measure} 기준을 지원하지 않습니다 (가능: {', '.join(MEASURES)})")
+        
+        analytics = get_timeseries_analytics()
+        scope_code = get_region_rankings().resolve_scope(scope)
+        if scope_code is None or (metric, measure, scope_code) not in analytics.order:
+            raise HTTPException(status_code=404, detail=f"{scope} 범위를 찾을 수 없습니다")
+        
+        return {
+            "metric": metric,
+            "metric_name": TIMESERIES_METRICS[metric][0],
+            "measure": measure,
+            "measure_name": MEASURES[measure],
+            "direction": "decline" if direction == "decline" else "growth",
+            "scope": scope_code,
+            "years": analytics.years,
+            "items": analytics.movers(metric, measure, scope_code, max(k, 0), descending=(direction != "decline")),
+            "total": int(analytics.order[(metric, measure, scope_code)].size)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/timeseries/compare")
+async def compare_timeseries(codes: str, metrics: Optional[str] = None):
+    """여러 읍면동 시계열 비교 (codes, metrics: 쉼표 구분)"""
+    try:
+        code_list = [c.strip() for c in codes.split(',') if c.strip()]
+        if not code_list:
+            raise HTTPException(status_code=400, detail="codes를 입력하세요")
+        
+        metric_list = [m.strip() for m in metrics.split(',') if m.strip()] if metrics else list(TIMESERIES_METRICS)
+        unknown = [m for m in metric_list if m not in TIMESERIES_METRICS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"{', '.join(unknown)} 지표를 지원하지 않습니다")
+        
+        return get_timeseries_analytics().compare(code_list, metric_list)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/politicians/emdong/{emdong_code}")
-async def get_politicians_by_emdong(emdong_code: str):
+def get_politicians_by_emdong(emdong_code: str):
     """특정 읍면동의 정치인 정보 (행정동 코드 기반)"""
     try:
         # 읍면동 정보 로드
@@ -617,81 +949,26 @@ async def get_politicians_by_emdong(emdong_code: str):
 async def get_regions():
     """지역 목록 (서울 읍면동)"""
     try:
-        seoul_data = load_json_file("seoul_comprehensive_data.json")
-        
-        # regions 키 안에 실제 데이터가 있음
-        regions_data = seoul_data.get('regions', {})
-        
-        # 서울 구/동 목록
-        regions = []
-        for key, value in regions_data.items():
-            if isinstance(value, dict):
-                sido = value.get('sido_name', '서울특별시')
-                sigungu = value.get('sigungu_name', '')
-                dong = value.get('dong_name', '')
-                
-                pop_data = value.get('population_data', {})
-                
-                regions.append({
-                    "code": key,
-                    "sido": sido,
-                    "sigungu": sigungu,
-                    "dong": dong,
-                    "name": f"{sigungu} {dong}".strip() if dong else sigungu,
-                    "population": pop_data.get('total_population', 0),
-                    "avg_age": pop_data.get('total_avg_age', 0),
-                    "density": pop_data.get('population_density', 0),
-                    "is_gu": not dong
-                })
-        
-        # 구별로 그룹화
-        by_gu = defaultdict(list)
-        for region in regions:
-            by_gu[region['sigungu']].append(region)
-        
-        return {
-            "regions": regions,
-            "by_gu": dict(by_gu),
-            "total": len(regions),
-            "gu_count": len(by_gu)
-        }
+        view = get_seoul_region_view()
+        return Response(content=view.list_body, media_type="application/json",
+                        headers={"ETag": f'"{view.version}"'})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/regions/{code}")
 async def get_region_detail(code: str):
-    """지역 상세 정보 (통합)"""
+    """지역 상세 정보 (GDP, 교통, 안전, 교육, 상권 병합)"""
     try:
-        seoul_data = load_json_file("seoul_comprehensive_data.json")
-        gdp_data = load_json_file("seoul_gdp_data.json")
-        traffic_data = load_json_file("seoul_traffic_data.json")
-        safety_data = load_json_file("seoul_safety_data.json")
-        
-        regions_data = seoul_data.get('regions', {})
-        
-        # 코드로 찾기
-        region = None
-        for key, value in regions_data.items():
-            if code == key or code in key:
-                region = value.copy()
-                break
+        view = get_seoul_region_view()
+        body = view.detail_body(code)
         
-        if not region:
+        if body is None:
             raise HTTPException(status_code=404, detail=f"{code} 데이터를 찾을 수 없습니다")
         
-        # 추가 데이터 병합
-        sigungu = region.get('sigungu_name', '')
-        
-        if sigungu in gdp_data:
-            region['gdpData'] = gdp_data[sigungu]
-        
-        if sigungu in traffic_data:
-            region['trafficData'] = traffic_data[sigungu]
-        
-        if sigungu in safety_data:
-            region['safetyData'] = safety_data[sigungu]
-        
-        return region
+        return Response(content=body, media_type="application/json",
+                        headers={"ETag": f'"{view.version}"'})
     except HTTPException:
         raise
     except Exception as e:
@@ -720,12 +997,13 @@ async def get_district_lda(gu: str):
 async def get_assembly_lda(name: str):
     """국회의원 LDA 분석"""
     try:
-        data = load_json_file("assembly_member_lda_analysis.json")
+        store = get_article_store()
+        profile = store.member_lda.get(name)
         
-        if name not in data:
+        if profile is None:
             raise HTTPException(status_code=404, detail=f"{name} 의원의 데이터를 찾을 수 없습니다")
         
-        return data[name]
+        return store.render_lda(profile)
     except HTTPException:
         raise
     except Exception as e:
@@ -750,31 +1028,46 @@ async def get_local_lda(name: str):
 # 정치인 API
 # ============================================
 
-@app.get("/api/politicians/assembly")
+def build_assembly_member_list() -> AssemblyMemberListResponse:
+    """국회의원 목록 (구분/지역/정당을 채운 응답 구조체)"""
+    data = load_json_file("assembly_by_region.json")
+    
+    def to_member(member: Dict[str, Any], member_type: str, region: Optional[str] = None,
+                  party: Optional[str] = None) -> AssemblyMember:
+        return AssemblyMember(
+            name=member.get('name', ''),
+            party=party or member.get('party', ''),
+            district=member.get('district', ''),
+            committee=member.get('committee', ''),
+            gender=member.get('gender', ''),
+            term_count=member.get('term_count', ''),
+            type=member_type,
+            region=region
+        )
+    
+    all_members = []
+    
+    # 지역구 의원
+    if "regional" in data:
+        for region, members in data["regional"].items():
+            for member in members:
+                all_members.append(to_member(member, "regional", region=region))
+    
+    # 비례대표
+    if "proportional" in data:
+        for party, members in data["proportional"].items():
+            for member in members:
+                all_members.append(to_member(member, "proportional", party=party))
+    
+    return AssemblyMemberListResponse(all_members, len(all_members))
+
+@app.get("/api/politicians/assembly", response_model=AssemblyMemberListResponse)
 async def get_assembly_members():
     """국회의원 목록"""
     try:
-        data = load_json_file("assembly_by_region.json")
-        
-        all_members = []
-        
-        # 지역구 의원
-        if "regional" in data:
-            for region, members in data["regional"].items():
-                for member in members:
-                    member["type"] = "regional"
-                    member["region"] = region
-                    all_members.append(member)
-        
-        # 비례대표
-        if "proportional" in data:
-            for party, members in data["proportional"].items():
-                for member in members:
-                    member["type"] = "proportional"
-                    member["party"] = party
-                    all_members.append(member)
-        
-        return {"members": all_members, "total": len(all_members)}
+        return FastJSONResponse(get_derived("assembly_members", build_assembly_member_list))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -783,11 +1076,13 @@ async def get_assembly_members():
 # ============================================
 
 @app.get("/api/network/assembly")
-async def get_assembly_network():
-    """국회의원-이슈 네트워크"""
+def get_assembly_network():
+    """국회의원-이슈 네트워크 (그래프 전체를 한 번만 인코딩)"""
     try:
-        data = load_json_file("assembly_network_graph.json")
-        return data
+        body = get_derived("assembly_network_body", lambda: encode_json(load_json_file("assembly_network_graph.json")))
+        return Response(content=body, media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -795,12 +1090,16 @@ async def get_assembly_network():
 async def get_issue_tracking(issue: str):
     """이슈별 기사 추적"""
     try:
-        data = load_json_file("issue_articles_tracking.json")
+        store = get_article_store()
+        view = store.issues.get(issue)
         
-        if issue not in data:
+        if view is None:
             raise HTTPException(status_code=404, detail=f"{issue} 이슈를 찾을 수 없습니다")
         
-        return data[issue]
+        return {
+            **store.render_view(view, "articles"),
+            "top_keywords": store.top_keywords("issues", issue)
+        }
     except HTTPException:
         raise
     except Exception as e:
@@ -820,12 +1119,253 @@ async def get_clusters():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# ============================================
+# 뉴스 API
+# ============================================
+
+@app.get("/api/news/gu/{gu}")
+async def get_gu_news(gu: str, type: Optional[str] = "news", offset: int = Query(0, ge=0),
+                      limit: Optional[int] = Query(None, ge=1)):
+    """구별 뉴스 (type=news: 지역 뉴스, type=audit: 국정감사 뉴스)"""
+    try:
+        store = get_article_store()
+        views = store.gu_audit if type == "audit" else store.gu_news
+        view = views.get(gu)
+        
+        if view is None:
+            raise HTTPException(status_code=404, detail=f"{gu} 뉴스를 찾을 수 없습니다")
+        
+        return store.render_view(view, "news", offset, limit)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/news/gu/{gu}/keywords")
+async def get_gu_keywords(gu: str, type: Optional[str] = "news", limit: int = Query(20, ge=1)):
+    """구별 뉴스 키워드 (증분 적재 반영)"""
+    scope = "gu_audit" if type == "audit" else "gu_news"
+    keywords = get_article_store().top_keywords(scope, gu, limit)
+    
+    if not keywords:
+        raise HTTPException(status_code=404, detail=f"{gu} 키워드를 찾을 수 없습니다")
+    
+    return {"gu": gu, "type": type, "top_keywords": keywords}
+
+@app.get("/api/news/assembly/{name}")
+async def get_member_news(name: str, offset: int = Query(0, ge=0), limit: Optional[int] = Query(None, ge=1)):
+    """국회의원별 뉴스"""
+    try:
+        store = get_article_store()
+        view = store.member_news.get(name)
+        
+        if view is None:
+            raise HTTPException(status_code=404, detail=f"{name} 의원의 뉴스를 찾을 수 없습니다")
+        
+        return store.render_view(view, "news", offset, limit)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/news/article/{article_id}")
+async def get_article(article_id: str):
+    """기사 단건 조회 (재배포 기사면 duplicate_of에 대표 기사 ID)"""
+    store = get_article_store()
+    article = store.get(article_id)
+    
+    if article is None:
+        raise HTTPException(status_code=404, detail=f"{article_id} 기사를 찾을 수 없습니다")
+    
+    result = article.to_dict()
+    if article_id in store.aliases:
+        result["duplicate_of"] = store.aliases[article_id]
+    return result
+
+@app.get("/api/news/stats")
+async def get_news_stats():
+    """기사 저장소 통계"""
+    return get_article_store().stats()
+
+class NewsIngestArticle(BaseModel):
+    """적재할 기사 1건 (기사 필드 + 반영 대상)"""
+    title: str
+    description: Optional[str] = None
+    link: Optional[str] = None
+    originallink: Optional[str] = None
+    pubDate: Optional[str] = None
+    gu: Optional[str] = None
+    gu_type: Optional[Literal["news", "audit"]] = None
+    politician: Optional[str] = None
+    member: Optional[str] = None
+    member_party: Optional[str] = None
+    member_district: Optional[str] = None
+    issue: Optional[str] = None
+
+class NewsIngestRequest(BaseModel):
+    """신규 기사 적재 요청"""
+    articles: List[NewsIngestArticle]
+
+@app.post("/api/news/ingest")
+def ingest_news(request: NewsIngestRequest, wait: bool = False,
+                x_ingest_token: Optional[str] = Header(default=None)):
+    """신규 기사를 로그에 덧붙임 (소비자가 수 초 내 반영, wait=true면 즉시 반영)
+
+    X-Ingest-Token 헤더가 NEWS_INGEST_TOKEN과 같아야 한다.
+    fsync와 로그 반영은 블로킹이므로 일반 함수로 두어 스레드 풀에서 실행한다.
+    """
+    if not NEWS_INGEST_TOKEN:
+        raise HTTPException(status_code=503, detail="뉴스 적재 API가 비활성화되어 있습니다 (NEWS_INGEST_TOKEN 미설정)")
+    if not x_ingest_token or not hmac.compare_digest(x_ingest_token.encode('utf-8'), NEWS_INGEST_TOKEN.encode('utf-8')):
+        raise HTTPException(status_code=403, detail="적재 토큰이 올바르지 않습니다")
+    
+    records = [article.model_dump(exclude_none=True) for article in request.articles]
+    for record in records:
+        try:
+            validate_record(record)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        segment, offset = news_log.append(records)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"로그 기록 실패: {str(e)}")
+    
+    if wait:
+        news_consumer.poll()
+    else:
+        news_consumer.notify()
+    
+    return {
+        "accepted": len(request.articles),
+        "segment": segment,
+        "offset": offset,
+        "synced": wait
+    }
+
+@app.get("/api/news/ingest/status")
+async def get_ingest_status():
+    """증분 적재 소비자 상태"""
+    return news_consumer.status()
+
+# ============================================
+# 선거 결과 API
+# ============================================
+
+def get_election_table(election_type: str, year: str):
+    analytics = get_election_analytics()
+    if election_type not in ELECTION_TYPES:
+        raise HTTPException(status_code=404, detail=f"{election_type} 선거 유형을 찾을 수 없습니다")
+    table = analytics.table(election_type, year)
+    if table is None:
+        raise HTTPException(status_code=404, detail=f"{year}년 {ELECTION_TYPES[election_type]} 선거를 찾을 수 없습니다")
+    return analytics, table
+
+@app.get("/api/elections")
+async def get_elections():
+    """선거 유형/연도 목록"""
+    try:
+        return get_election_analytics().summary()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/elections/emdong/{emdong_code}")
+async def get_emdong_elections(emdong_code: str):
+    """읍면동이 속한 선거구의 역대 선거 결과"""
+    try:
+        result = get_election_analytics().emdong_results(emdong_code)
+        
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"{emdong_code} 읍면동의 선거 데이터를 찾을 수 없습니다")
+        
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/elections/{election_type}/{year}")
+async def get_election_results(election_type: str, year: str):
+    """선거구별 결과 전체"""
+    try:
+        analytics, table = get_election_table(election_type, year)
+        
+        return {
+            "election_type": election_type,
+            "year": year,
+            "vote_data": table.has_vote_data,
+            "districts": [table.district_row(d, analytics.parties) for d in range(len(table.districts))],
+            "total": len(table.districts)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/elections/{election_type}/{year}/district/{district}")
+async def get_election_district(election_type: str, year: str, district: str):
+    """선거구 결과 (득표율, 표차, 투표율, 스윙)"""
+    try:
+        analytics, table = get_election_table(election_type, year)
+        row = table.district_index.get(district)
+        
+        if row is None:
+            raise HTTPException(status_code=404, detail=f"{district} 선거구를 찾을 수 없습니다")
+        
+        return {
+            "election_type": election_type,
+            "year": year,
+            **table.district_row(row, analytics.parties)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/elections/{election_type}/{year}/sigungu")
+async def get_election_sigungu_rollup(election_type: str, year: str):
+    """시군구별 정당 의석/득표 집계"""
+    try:
+        _, table = get_election_table(election_type, year)
+        
+        return {
+            "election_type": election_type,
+            "year": year,
+            "vote_data": table.has_vote_data,
+            "sigungu": list(table.sigungu_rollup.values()),
+            "total": len(table.sigungu_rollup)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/elections/{election_type}/{year}/closest")
+async def get_closest_races(election_type: str, year: str, k: int = 20):
+    """접전 선거구 순위 (표차 오름차순)"""
+    try:
+        analytics, table = get_election_table(election_type, year)
+        
+        return {
+            "election_type": election_type,
+            "year": year,
+            "vote_data": table.has_vote_data,
+            "races": analytics.closest(table, max(k, 0)),
+            "total": int(table.closest_order.size)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # ============================================
 # 검색 API
 # ============================================
 
 @app.get("/api/search")
-async def search(q: str, type: Optional[str] = None):
+def search(q: str, type: Optional[str] = None):
     """통합 검색"""
     if not q:
         raise HTTPException(status_code=400, detail="검색어를 입력하세요")
@@ -834,7 +1374,8 @@ async def search(q: str, type: Optional[str] = None):
         "query": q,
         "regions": [],
         "assembly_members": [],
-        "local_politicians": []
+        "local_politicians": [],
+        "news": []
     }
     
     try:
@@ -859,6 +1400,10 @@ async def search(q: str, type: Optional[str] = None):
                     if q.lower() in member.get("name", "").lower():
                         results["assembly_members"].append(member)
         
+        # 뉴스 제목 검색
+        if not type or type == "news":
+            results["news"] = get_article_store().search(q)
+        
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 기사 증분 적재 (append-only 로그 + 프로세스 내 소비자)
+
+- NewsLog: DATA_DIR/news_log 아래 NDJSON 세그먼트 파일에 기사를 덧붙인다
+  (segment-000001.ndjson, segment-000002.ndjson, ... + 압축본 compacted.ndjson)
+- NewsIngestConsumer: 로그를 따라 읽으며 ArticleStore.ingest로 구/의원/이슈 뷰,
+  검색 색인, 키워드 집계에 반영하고, 주기적으로 봉인된 세그먼트를 압축한다
+
+ArticleStore.ingest는 같은 레코드를 다시 적용해도 결과가 같으므로,
+압축으로 세그먼트가 사라지거나 여러 워커가 같은 로그를 읽어도 안전하다.
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+from article_store import ArticleStore, article_id
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".ndjson"
+COMPACTED_FILE = "compacted.ndjson"
+LOCK_FILE = ".lock"
+
+# 활성 세그먼트 최대 크기 (넘으면 새 세그먼트로 전환)
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+# 소비자 폴링 주기 (초)
+POLL_INTERVAL = 1.0
+# 압축 주기 (초)
+COMPACTION_INTERVAL = 600.0
+
+# 기사 필드 + 라우팅 필드 (그 외 필드는 로그에 남기지 않음)
+RECORD_FIELDS = (
+    "title", "description", "link", "originallink", "pubDate",
+    "gu", "gu_type", "politician", "member", "member_party", "member_district", "issue",
+)
+GU_TYPES = ("news", "audit")
+
+
+def validate_record(record: Dict[str, Any]):
+    """로그 레코드 검사 (잘못된 레코드면 ValueError)
+
+    API는 요청 모델로 먼저 걸러내지만, 로그는 다른 워커/이전 버전이 쓴 레코드도 읽으므로 다시 확인한다.
+    """
+    for field in RECORD_FIELDS:
+        value = record.get(field)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{field} 필드는 문자열이어야 합니다: {type(value).__name__}")
+    if record.get('gu_type') is not None and record['gu_type'] not in GU_TYPES:
+        raise ValueError(f"알 수 없는 gu_type: {record['gu_type']}")
+    if not record.get('title') or not (record.get('originallink') or record.get('link')):
+        raise ValueError("title과 link(또는 originallink)는 필수입니다")
+    if not (record.get('gu') or record.get('member') or record.get('issue')):
+        raise ValueError("gu, member, issue 중 하나는 지정해야 합니다")
+
+
+class NewsLog:
+    """append-only NDJSON 세그먼트 로그"""
+
+    def __init__(self, log_dir: Path, segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        self.log_dir = log_dir
+        self.segment_max_bytes = segment_max_bytes
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.log_dir / f"{SEGMENT_PREFIX}{seq:06d}{SEGMENT_SUFFIX}"
+
+    def segments(self) -> List[int]:
+        """세그먼트 번호 목록 (오름차순)"""
+        if not self.log_dir.exists():
+            return []
+        result = []
+        for path in self.log_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                result.append(int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+            except ValueError:
+                continue
+        return sorted(result)
+
+    def _locked(self, blocking: bool = True):
+        """프로세스 간 잠금 (여러 uvicorn 워커가 같은 로그에 쓰는 경우)"""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.log_dir / LOCK_FILE, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def append(self, records: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """레코드 덧붙이기, 기록 후 (세그먼트 번호, 끝 오프셋) 반환"""
+        lines = "".join(
+            json.dumps({k: record[k] for k in RECORD_FIELDS if k in record}, ensure_ascii=False) + "\n"
+            for record in records
+        ).encode('utf-8')
+
+        lock_file = self._locked()
+        try:
+            segments = self.segments()
+            seq = segments[-1] if segments else 1
+            path = self._segment_path(seq)
+            if path.exists() and path.stat().st_size + len(lines) > self.segment_max_bytes:
+                seq += 1
+                path = self._segment_path(seq)
+            with open(path, 'ab') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+                return seq, f.tell()
+        finally:
+            lock_file.close()
+
+    def read_compacted(self) -> Tuple[Optional[Tuple[int, int]], List[Dict[str, Any]]]:
+        """압축본 전체 읽기, (파일 식별자(inode, mtime), 레코드 목록) 반환"""
+        path = self.log_dir / COMPACTED_FILE
+        try:
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                return (st.st_ino, st.st_mtime_ns), list(_parse_lines(f.read()))
+        except FileNotFoundError:
+            return None, []
+
+    def read_segment(self, seq: int, offset: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """세그먼트의 offset 이후 완전한 줄만 읽기, (새 오프셋, 레코드 목록) 반환"""
+        try:
+            with open(self._segment_path(seq), 'rb') as f:
+                f.seek(offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return offset, []
+        # 쓰는 중인 마지막 줄은 다음 번에 읽음
+        end = chunk.rfind(b"\n") + 1
+        return offset + end, list(_parse_lines(chunk[:end]))
+
+    def compact(self) -> Optional[Dict[str, Any]]:
+        """봉인된 세그먼트(활성 세그먼트 제외)를 압축본으로 병합
+
+        같은 기사·같은 대상 레코드는 하나만 남긴다. 다른 워커가 압축 중이면 건너뛴다.
+        """
+        lock_file = self._locked(blocking=False)
+        if lock_file is None:
+            return None
+        try:
+            sealed = self.segments()[:-1]
+            if not sealed:
+                return None
+
+            _, records = self.read_compacted()
+            before = len(records)
+            for seq in sealed:
+                _, segment_records = self.read_segment(seq, 0)
+                records.extend(segment_records)
+
+            seen = set()
+            merged = []
+            for record in records:
+                key = (article_id(record),) + tuple(record.get(k) for k in RECORD_FIELDS[5:])
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(record)
+
+            tmp_path = self.log_dir / f"{COMPACTED_FILE}.tmp"
+            with open(tmp_path, 'wb') as f:
+                for record in merged:
+                    f.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.log_dir / COMPACTED_FILE)
+            for seq in sealed:
+                self._segment_path(seq).unlink(missing_ok=True)
+
+            return {
+                "segments": len(sealed),
+                "records_in": len(records),
+                "records_out": len(merged),
+                "compacted_before": before,
+            }
+        finally:
+            lock_file.close()
+
+
+def _parse_lines(data: bytes) -> Iterator[Dict[str, Any]]:
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+class NewsIngestConsumer:
+    """로그를 따라 읽어 기사 저장소에 반영하는 백그라운드 스레드"""
+
+    def __init__(self, log: NewsLog, store_provider, poll_interval: float = POLL_INTERVAL,
+                 compaction_interval: float = COMPACTION_INTERVAL):
+        self.log = log
+        self.store_provider = store_provider  # 호출하면 ArticleStore 반환
+        self.poll_interval = poll_interval
+        self.compaction_interval = compaction_interval
+        self.compacted_id: Optional[Tuple[int, int]] = None
+        self.position: Tuple[int, int] = (0, 0)  # (세그먼트 번호, 오프셋)
+        self.applied = 0
+        self.read = 0
+        self.rejected = 0
+        self.last_rejected: Optional[str] = None
+        self.last_poll: Optional[float] = None
+        self.last_compaction: Optional[Dict[str, Any]] = None
+        self.last_compaction_time = time.time()
+        self.last_error: Optional[str] = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._poll_lock = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="news-ingest", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+
+    def notify(self):
+        """같은 프로세스에서 로그에 쓴 직후 호출하면 바로 반영"""
+        self._wakeup.set()
+
+    def _apply(self, store: ArticleStore, records: List[Dict[str, Any]]):
+        # 잘못된 레코드 하나 때문에 위치가 멈추지 않도록 레코드별로 건너뛰고 집계한다
+        self.read += len(records)
+        for record in records:
+            try:
+                validate_record(record)
+                if store.ingest(record):
+                    self.applied += 1
+            except Exception as e:
+                self.rejected += 1
+                self.last_rejected = f"{str(record.get('link') or record.get('originallink'))[:200]}: {e}"
+                print(f"⚠️ 뉴스 레코드 건너뜀: {self.last_rejected}")
+
+    def poll(self) -> int:
+        """로그에서 새 레코드를 읽어 반영, 반영된 레코드 수 반환"""
+        # 저장소 구성(get_article_store)도 poll()을 부르므로 잠금 밖에서 먼저 가져온다 (잠금 순서 역전 방지)
+        store = self.store_provider()
+        with self._poll_lock:
+            applied_before = self.applied
+
+            compacted_id, records = self.log.read_compacted()
+            if compacted_id != self.compacted_id:
+                # 압축본이 바뀌었으면 전체 재적용 (ingest가 멱등이므로 안전)
+                self._apply(store, records)
+                self.compacted_id = compacted_id
+
+            seq, offset = self.position
+            for segment in self.log.segments():
+                if segment < seq:
+                    continue
+                if segment > seq:
+                    seq, offset = segment, 0
+                offset, records = self.log.read_segment(seq, offset)
+                self._apply(store, records)
+            self.position = (seq, offset)
+            self.last_poll = time.time()
+            return self.applied - applied_before
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+                if time.time() - self.last_compaction_time >= self.compaction_interval:
+                    self.last_compaction_time = time.time()
+                    result = self.log.compact()
+                    if result:
+                        self.last_compaction = {**result, "time": self.last_compaction_time}
+                        print(f"🗜️ 뉴스 로그 압축: 세그먼트 {result['segments']}개, "
+                              f"{result['records_in']}건 → {result['records_out']}건")
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"❌ 뉴스 적재 실패: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "log_dir": str(self.log.log_dir),
+            "segments": self.log.segments(),
+            "position": {"segment": self.position[0], "offset": self.position[1]},
+            "read": self.read,
+            "applied": self.applied,
+            "rejected": self.rejected,
+            "last_rejected": self.last_rejected,
+            "last_poll": self.last_poll,
+            "last_compaction": self.last_compaction,
+            "last_error": self.last_error,
+        }
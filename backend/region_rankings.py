@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지역 지표 순위/백분위
+
+SGIS 읍면동·시군구 지표마다 범위(전국/시도/시군구)별 내림차순 정렬 인덱스(argsort)를
+미리 만들어 두고, 상위 k개는 정렬 인덱스를 잘라서(O(k)) 응답한다.
+읍면동별 순위·백분위도 구성 시점에 함께 계산한다.
+"""
+
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+# 지표 이름 -> 설명
+EMDONG_METRICS = {
+    "population": "인구",
+    "household_cnt": "가구수",
+    "avg_family_size": "평균 가구원수",
+    "house_cnt": "주택수",
+    "company_cnt": "사업체수",
+    "worker_cnt": "종사자수",
+}
+
+SIGUNGU_METRICS = {
+    "total_population": "인구",
+    "total_household": "가구수",
+    "total_company": "사업체수",
+    "total_worker": "종사자수",
+    "emdong_count": "읍면동 수",
+}
+
+NATIONAL_SCOPE = "national"
+
+
+class RankingLevel:
+    """한 단위(읍면동 또는 시군구)의 지표 배열 + 범위별 정렬 인덱스"""
+
+    def __init__(self, rows: List[Dict[str, Any]], metrics: Dict[str, str], scope_keys: List[str]):
+        """rows: code, name, sido_code, sido_name, (sigungu_code, sigungu_name), 지표 값
+        scope_keys: 범위로 쓸 행 필드 (예: ['sido_code', 'sigungu_code'])
+        """
+        self.metrics = metrics
+        self.codes = [row['code'] for row in rows]
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.labels = [
+            {k: row.get(k, '') for k in ('code', 'name', 'sido_code', 'sido_name', 'sigungu_code', 'sigungu_name') if k in row}
+            for row in rows
+        ]
+        self.values: Dict[str, np.ndarray] = {
+            metric: np.array([float(row.get(metric) or 0) for row in rows], dtype=np.float64)
+            for metric in metrics
+        }
+
+        # 범위 -> 구성원 인덱스
+        self.scopes: Dict[str, np.ndarray] = {NATIONAL_SCOPE: np.arange(len(rows))}
+        self.scope_of: Dict[str, List[str]] = {key: [row.get(key, '') for row in rows] for key in scope_keys}
+        for key in scope_keys:
+            groups: Dict[str, List[int]] = {}
+            for i, value in enumerate(self.scope_of[key]):
+                if value:
+                    groups.setdefault(value, []).append(i)
+            for value, members in groups.items():
+                self.scopes[value] = np.array(members)
+
+        # (지표, 범위) -> 내림차순 정렬 인덱스 / 오름차순 정렬 값
+        self.order: Dict[Tuple[str, str], np.ndarray] = {}
+        self.sorted_values: Dict[Tuple[str, str], np.ndarray] = {}
+        for metric, values in self.values.items():
+            for scope, members in self.scopes.items():
+                scoped = values[members]
+                ascending = np.argsort(scoped, kind='stable')
+                self.order[(metric, scope)] = members[ascending[::-1]]
+                self.sorted_values[(metric, scope)] = scoped[ascending]
+
+        # 행별 순위/백분위 (지표 -> 범위 종류 -> 배열)
+        self.rank: Dict[str, Dict[str, np.ndarray]] = {}
+        self.percentile: Dict[str, Dict[str, np.ndarray]] = {}
+        for metric, values in self.values.items():
+            self.rank[metric] = {}
+            self.percentile[metric] = {}
+            for scope_kind in [NATIONAL_SCOPE] + scope_keys:
+                rank = np.zeros(len(rows), dtype=np.int32)
+                percentile = np.zeros(len(rows), dtype=np.float64)
+                for scope, members in self._scopes_of_kind(scope_kind):
+                    sorted_values = self.sorted_values[(metric, scope)]
+                    scoped = values[members]
+                    below = np.searchsorted(sorted_values, scoped, side='left')
+                    at_or_below = np.searchsorted(sorted_values, scoped, side='right')
+                    # 순위: 나보다 큰 값 개수 + 1 / 백분위: 나 이하 비율
+                    rank[members] = len(members) - at_or_below + 1
+                    percentile[members] = (below + 0.5 * (at_or_below - below)) / len(members) * 100
+                self.rank[metric][scope_kind] = rank
+                self.percentile[metric][scope_kind] = percentile
+
+    def _scopes_of_kind(self, scope_kind: str):
+        if scope_kind == NATIONAL_SCOPE:
+            yield NATIONAL_SCOPE, self.scopes[NATIONAL_SCOPE]
+            return
+        for value in set(self.scope_of[scope_kind]):
+            if value:
+                yield value, self.scopes[value]
+
+    def top(self, metric: str, scope: str, k: int, ascending: bool = False) -> List[Dict[str, Any]]:
+        order = self.order[(metric, scope)]
+        picked = order[::-1][:k] if ascending else order[:k]
+        values = self.values[metric]
+        return [
+            {"rank": position + 1, **self.labels[i], "value": _value(values[i])}
+            for position, i in enumerate(picked)
+        ]
+
+    def percentiles(self, code: str) -> Optional[Dict[str, Any]]:
+        i = self.index.get(code)
+        if i is None:
+            return None
+        result = {}
+        for metric in self.metrics:
+            entry: Dict[str, Any] = {"value": _value(self.values[metric][i])}
+            for scope_kind in self.rank[metric]:
+                scope = NATIONAL_SCOPE if scope_kind == NATIONAL_SCOPE else self.scope_of[scope_kind][i]
+                if not scope:
+                    continue
+                entry[scope_kind.replace('_code', '')] = {
+                    "scope": scope,
+                    "rank": int(self.rank[metric][scope_kind][i]),
+                    "total": int(len(self.scopes[scope])),
+                    "percentile": round(float(self.percentile[metric][scope_kind][i]), 2),
+                }
+            result[metric] = entry
+        return {**self.labels[i], "metrics": result}
+
+
+def _value(value: float):
+    return int(value) if float(value).is_integer() else round(float(value), 4)
+
+
+class RegionRankings:
+    """읍면동/시군구 순위 색인"""
+
+    def __init__(self, emdong_rows: List[Dict[str, Any]], sigungu_rows: List[Dict[str, Any]],
+                 sido_names: Dict[str, str]):
+        self.levels = {
+            "emdong": RankingLevel(emdong_rows, EMDONG_METRICS, ['sido_code', 'sigungu_code']),
+            "sigungu": RankingLevel(sigungu_rows, SIGUNGU_METRICS, ['sido_code']),
+        }
+        self.sido_names = sido_names
+        self.sigungu_names = {row['code']: row.get('name', '') for row in sigungu_rows}
+
+    def resolve_scope(self, scope: Optional[str]) -> Optional[str]:
+        """범위 해석: national / 시도 코드 / 시도 이름(앞부분, 예: '경기') / 시군구 코드"""
+        if not scope or scope == NATIONAL_SCOPE:
+            return NATIONAL_SCOPE
+        if scope in self.sido_names or scope in self.sigungu_names:
+            return scope
+        for code, name in self.sido_names.items():
+            # '경기' -> 경기도, '경북' -> 경상북도
+            short = name[0] + name[2] if len(name) == 4 and name.endswith('도') else name
+            if name.startswith(scope) or short == scope:
+                return code
+        return None
+
+    def scope_name(self, scope: str) -> str:
+        if scope == NATIONAL_SCOPE:
+            return "전국"
+        return self.sido_names.get(scope) or self.sigungu_names.get(scope, '')
+
+
+def build_region_rankings(emdong_rows: List[Dict[str, Any]], sigungu_rows: List[Dict[str, Any]],
+                          sido_names: Dict[str, str]) -> RegionRankings:
+    start = time.time()
+    rankings = RegionRankings(emdong_rows, sigungu_rows, sido_names)
+    print(f"✅ 지역 순위 색인 구성 완료: 읍면동 {len(emdong_rows)}개, 시군구 {len(sigungu_rows)}개 "
+          f"({time.time() - start:.2f}초)")
+    return rankings
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서울 지역 materialized view (/api/regions, /api/regions/{code})
+
+seoul_comprehensive_data.json 의 지역마다 구 단위 GDP, 교통, 안전, 교육, 상권 데이터를
+미리 병합해 두고, 응답 본문도 JSON 바이트로 미리 인코딩한다 (다른 응답과 같은 serialization.encode_json).
+데이터 파일이 바뀌면(수정 시각/크기 기준 데이터 버전) 다시 구성한다.
+
+지역 코드 조회는 기존 동작(code == key 또는 code in key, 첫 번째 일치)과 같게
+정확 일치 색인 + 부분 문자열 색인으로 처리한다.
+"""
+
+import hashlib
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from serialization import encode_json
+
+REGION_SOURCE = "seoul_comprehensive_data.json"
+
+# 구 단위 병합 데이터: (파일, 응답 키)
+JOIN_SOURCES = [
+    ("seoul_gdp_data.json", "gdpData"),
+    ("seoul_traffic_data.json", "trafficData"),
+    ("seoul_safety_data.json", "safetyData"),
+    ("seoul_education_data.json", "educationData"),
+    ("seoul_commercial_area_data.json", "commercialData"),
+]
+
+VIEW_SOURCES = [REGION_SOURCE] + [filename for filename, _ in JOIN_SOURCES]
+
+
+def data_version(data_dir: Path, filenames: List[str]) -> str:
+    """데이터 파일 버전 (파일별 수정 시각 + 크기 해시)"""
+    digest = hashlib.blake2b(digest_size=8)
+    for filename in filenames:
+        try:
+            st = (data_dir / filename).stat()
+            digest.update(f"{filename}:{st.st_mtime_ns}:{st.st_size};".encode())
+        except FileNotFoundError:
+            digest.update(f"{filename}:-;".encode())
+    return digest.hexdigest()
+
+
+class SeoulRegionView:
+    """미리 병합·인코딩된 서울 지역 데이터"""
+
+    def __init__(self, version: str, keys: List[str], bodies: List[bytes], list_body: bytes):
+        self.version = version
+        self.keys = keys
+        self.bodies = bodies
+        self.list_body = list_body
+        self.exact: Dict[str, int] = {key: i for i, key in enumerate(keys)}
+        # 부분 문자열 -> 첫 번째로 포함하는 지역 (기존 'code in key' 순회와 같은 결과)
+        self.substring: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            for start in range(len(key)):
+                for end in range(start + 1, len(key) + 1):
+                    self.substring.setdefault(key[start:end], i)
+
+    def find(self, code: str) -> Optional[int]:
+        if code in self.exact:
+            return self.exact[code]
+        return self.substring.get(code)
+
+    def detail_body(self, code: str) -> Optional[bytes]:
+        index = self.find(code)
+        return self.bodies[index] if index is not None else None
+
+
+def _region_summary(key: str, value: Dict[str, Any]) -> Dict[str, Any]:
+    sido = value.get('sido_name', '서울특별시')
+    sigungu = value.get('sigungu_name', '')
+    dong = value.get('dong_name', '')
+    pop_data = value.get('population_data', {})
+    return {
+        "code": key,
+        "sido": sido,
+        "sigungu": sigungu,
+        "dong": dong,
+        "name": f"{sigungu} {dong}".strip() if dong else sigungu,
+        "population": pop_data.get('total_population', 0),
+        "avg_age": pop_data.get('total_avg_age', 0),
+        "density": pop_data.get('population_density', 0),
+        "is_gu": not dong
+    }
+
+
+def build_seoul_region_view(data_dir: Path, version: Optional[str] = None) -> SeoulRegionView:
+    """지역 데이터 + 구 단위 데이터 병합, 목록/상세 응답 인코딩
+
+    seoul_comprehensive_data.json 이 없으면 FileNotFoundError, 병합 데이터 파일은 없으면 건너뛴다.
+    """
+    start = time.time()
+    version = version or data_version(data_dir, VIEW_SOURCES)
+
+    with open(data_dir / REGION_SOURCE, 'r', encoding='utf-8') as f:
+        regions_data = json.load(f).get('regions', {})
+
+    joins: List[Tuple[str, Dict[str, Any]]] = []
+    for filename, response_key in JOIN_SOURCES:
+        path = data_dir / filename
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                joins.append((response_key, json.load(f)))
+
+    keys: List[str] = []
+    bodies: List[bytes] = []
+    regions: List[Dict[str, Any]] = []
+    by_gu: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for key, value in regions_data.items():
+        if not isinstance(value, dict):
+            continue
+        sigungu = value.get('sigungu_name', '')
+        detail = dict(value)
+        for response_key, join_data in joins:
+            if sigungu in join_data:
+                detail[response_key] = join_data[sigungu]
+        keys.append(key)
+        bodies.append(encode_json(detail))
+
+        summary = _region_summary(key, value)
+        regions.append(summary)
+        by_gu[summary['sigungu']].append(summary)
+
+    list_body = encode_json({
+        "regions": regions,
+        "by_gu": dict(by_gu),
+        "total": len(regions),
+        "gu_count": len(by_gu)
+    })
+    view = SeoulRegionView(version, keys, bodies, list_body)
+    print(f"✅ 서울 지역 뷰 구성 완료: {len(keys)}개 지역, 병합 {len(joins)}종 ({time.time() - start:.2f}초)")
+    return view
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답 구조체 + 고속 JSON 인코딩 (orjson)
+
+FastAPI 기본 경로는 응답 dict 전체를 jsonable_encoder로 한 번 더 순회해 복사한 뒤
+json.dumps로 인코딩한다. 목록이 큰 응답은 슬롯 dataclass 구조체로 만들어 두고
+FastJSONResponse로 orjson이 바로 인코딩하게 해서 이 과정을 건너뛴다.
+(FrozenDict/FrozenList, numpy 배열도 그대로 인코딩된다)
+"""
+
+from dataclasses import dataclass
+from typing import List, Any, Optional
+
+import orjson
+from fastapi.responses import Response
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def encode_json(content: Any) -> bytes:
+    """orjson 인코딩 (UTF-8, 공백 없음, NaN은 null)"""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(Response):
+    """orjson으로 인코딩하는 JSON 응답"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+# ============================================
+# 읍면동 목록 (/api/national/sigungu/{code})
+# ============================================
+
+@dataclass(frozen=True, slots=True)
+class EmdongSummary:
+    code: str
+    name: str
+    full_address: str
+    household_cnt: int
+    population: int
+    avg_family_size: float
+    house_cnt: int
+    company_cnt: int
+    worker_cnt: int
+    x_coord: str
+    y_coord: str
+
+
+@dataclass(frozen=True, slots=True)
+class EmdongListResponse:
+    sigungu_code: str
+    sigungu_name: Optional[str]
+    emdong_list: List[EmdongSummary]
+    total: int
+
+
+# ============================================
+# 국회의원 목록 (/api/politicians/assembly)
+# ============================================
+
+@dataclass(frozen=True, slots=True)
+class AssemblyMember:
+    name: str
+    party: str
+    district: str
+    committee: str
+    gender: str
+    term_count: str
+    type: str
+    region: Optional[str] = None  # 지역구 의원만
+
+
+@dataclass(frozen=True, slots=True)
+class AssemblyMemberListResponse:
+    members: List[AssemblyMember]
+    total: int
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+읽기 전용 API 정적 내보내기 (nginx 정적 서빙용)
+
+DATA_DIR만으로 결정되는 GET 응답(시도/시군구/읍면동 목록, 읍면동 상세, 읍면동별 정치인,
+네트워크/클러스터, 의원별 LDA, 선거 결과, 서울 지역 등)을 경로/파라미터 조합마다
+미리 렌더링해 정적 파일 트리로 내보낸다.
+
+    {out}/api/national/sido.json                      <- /api/national/sido
+    {out}/api/national/emdong/11010530.year=2020.json <- /api/national/emdong/11010530?year=2020
+    {out}/api/...json.gz                              <- gzip 사전 압축 (nginx gzip_static)
+    {out}/manifest.json                               <- 그룹별 데이터 버전, 경로별 해시/크기
+
+- 렌더링은 프로세스 풀에서 FastAPI 앱을 직접 호출한다 (응답 바이트가 API와 같다).
+  경로 목록을 만들면서 구성한 저장소/색인은 워커가 fork 시점에 그대로 물려받는다
+- 경로 그룹마다 의존 데이터 파일 + 백엔드 코드 버전을 기록해 두고, 바뀐 그룹만 다시 렌더링한다
+- 내용 해시가 같은 파일은 다시 쓰지 않는다 (nginx ETag/Last-Modified 유지)
+- 200이 아닌 응답과 뉴스/검색/순위 질의 같은 동적 경로는 내보내지 않는다 (nginx가 백엔드로 넘김)
+
+사용법 (backend 디렉토리에서):
+    python static_export.py [--out DIR] [--workers N] [--full] [--groups national,emdong]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import quote
+
+from article_store import ARTICLE_SOURCES
+from seoul_region_view import VIEW_SOURCES, data_version
+
+BACKEND_DIR = Path(__file__).parent
+MANIFEST_FILE = "manifest.json"
+RENDER_CHUNK_SIZE = 64
+
+POLITICIAN_SOURCES = [
+    "sgis_comprehensive_stats.json",
+    "dong_election_mapping_complete.json",
+    "seoul_mayor_8th_real.json",
+    "seoul_gu_mayor_8th.json",
+    "national_assembly_22nd_real.json",
+    "seoul_si_uiwon_8th_real.json",
+    "seoul_gu_uiwon_8th_real.json",
+    "assembly_by_region.json",
+]
+
+ELECTION_SOURCES = [
+    "previous_election_data_complete.json",
+    "real_election_data.json",
+    "dong_election_mapping_complete.json",
+    "sgis_comprehensive_stats.json",
+]
+
+
+# ============================================
+# 경로 그룹 (그룹 이름, 의존 데이터 파일, 경로 목록 함수)
+# ============================================
+
+def _load(app_main, filename: str) -> Dict[str, Any]:
+    """데이터 파일 (없으면 빈 dict)"""
+    if not (app_main.DATA_DIR / filename).exists():
+        return {}
+    return app_main.load_json_file(filename)
+
+
+def _emdong_codes(app_main) -> List[str]:
+    return list(_load(app_main, "sgis_comprehensive_stats.json").get('regions', {}))
+
+
+def _national_paths(app_main) -> List[str]:
+    # 집계/읍면동 목록은 여기서 미리 구성해 두면 워커가 fork 시점에 물려받는다
+    if "sigungu" not in app_main.aggregated_cache:
+        app_main.aggregate_data_on_startup()
+    app_main.get_derived("emdong_lists", app_main.build_emdong_lists)
+    paths = ["/api/national/sido"]
+    for sido_cd, sido_info in _load(app_main, "sgis_national_regions.json").get('regions', {}).items():
+        paths.append(f"/api/national/sido/{sido_cd}")
+        for sigungu in sido_info.get('sigungu_list', []):
+            sigungu_cd = sigungu.get('sigungu_code')
+            if sigungu_cd:
+                paths.append(f"/api/national/sigungu/{sigungu_cd}")
+                paths.append(f"/api/national/sigungu/{sigungu_cd}/detail")
+    return paths
+
+
+def _emdong_paths(app_main) -> List[str]:
+    # 읍면동 상세/시계열은 다년도 데이터가 있어야 응답한다
+    if not (app_main.DATA_DIR / "sgis_multiyear_stats.json").exists():
+        return []
+    years = sorted(_load(app_main, "sgis_multiyear_stats.json").get('regions_by_year', {}))
+    enhanced = (app_main.DATA_DIR / "sgis_enhanced_multiyear_stats.json").exists()
+    paths = ["/api/years"]
+    for code in _emdong_codes(app_main):
+        paths.append(f"/api/national/emdong/{code}")
+        paths.extend(f"/api/national/emdong/{code}?year={year}" for year in years)
+        paths.append(f"/api/emdong/{code}/timeseries")
+        if enhanced:
+            paths.append(f"/api/emdong/{code}/enhanced")
+    return paths
+
+
+def _ranking_paths(app_main) -> List[str]:
+    codes = app_main.get_region_rankings().levels["emdong"].codes
+    return [f"/api/national/emdong/{code}/percentiles" for code in codes]
+
+
+def _politician_paths(app_main) -> List[str]:
+    app_main.get_derived("assembly_members", app_main.build_assembly_member_list)
+    return ["/api/politicians/assembly"] + [f"/api/politicians/emdong/{code}" for code in _emdong_codes(app_main)]
+
+
+def _network_paths(app_main) -> List[str]:
+    return ["/api/network/assembly", "/api/network/clusters", "/api/stats/summary"]
+
+
+def _lda_paths(app_main) -> List[str]:
+    paths = [f"/api/lda/assembly/{name}" for name in app_main.get_article_store().member_lda]
+    paths.extend(f"/api/lda/local/{name}" for name in _load(app_main, "local_politicians_lda_analysis.json"))
+    return paths
+
+
+def _election_paths(app_main) -> List[str]:
+    analytics = app_main.get_election_analytics()
+    paths = ["/api/elections"]
+    for election_type, tables in analytics.tables.items():
+        for year, table in sorted(tables.items()):
+            base = f"/api/elections/{election_type}/{year}"
+            paths.extend([base, f"{base}/sigungu", f"{base}/closest"])
+            paths.extend(f"{base}/district/{district}" for district in table.districts)
+    paths.extend(f"/api/elections/emdong/{code}" for code in analytics.emdong_codes)
+    return paths
+
+
+def _region_paths(app_main) -> List[str]:
+    if not (app_main.DATA_DIR / VIEW_SOURCES[0]).exists():
+        return []
+    return ["/api/regions"] + [f"/api/regions/{key}" for key in app_main.get_seoul_region_view().keys]
+
+
+EXPORT_GROUPS = [
+    ("national", ["sgis_national_regions.json", "sgis_comprehensive_stats.json", "sgis_commercial_stats.json",
+                  "sgis_tech_stats.json", "sgis_enhanced_multiyear_stats.json"], _national_paths),
+    ("emdong", ["sgis_comprehensive_stats.json", "sgis_multiyear_stats.json",
+                "sgis_enhanced_multiyear_stats.json"], _emdong_paths),
+    ("rankings", ["sgis_national_regions.json", "sgis_comprehensive_stats.json",
+                  "sgis_enhanced_multiyear_stats.json"], _ranking_paths),
+    ("politicians", POLITICIAN_SOURCES, _politician_paths),
+    ("network", ["assembly_network_graph.json", "assembly_by_region.json"], _network_paths),
+    ("lda", [filename for filename, _ in ARTICLE_SOURCES] + ["local_politicians_lda_analysis.json"], _lda_paths),
+    ("elections", ELECTION_SOURCES, _election_paths),
+    ("regions", VIEW_SOURCES, _region_paths),
+]
+
+
+# ============================================
+# 경로 <-> 파일
+# ============================================
+
+def export_file(path: str) -> Optional[str]:
+    """API 경로(쿼리 포함) -> 내보낼 파일 상대 경로 (nginx: $uri.$args.json)
+
+    파일 이름으로 쓸 수 없는 경로는 None (내보내지 않음)
+    """
+    route, _, query = path.partition('?')
+    segments = route.strip('/').split('/')
+    if any(not s or s in ('.', '..') or '\\' in s or '\0' in s for s in segments):
+        return None
+    name = '/'.join(segments)
+    return f"{name}.{query}.json" if query else f"{name}.json"
+
+
+def _request_url(path: str) -> str:
+    route, sep, query = path.partition('?')
+    return quote(route) + sep + query
+
+
+# ============================================
+# 렌더링 (프로세스 풀 워커)
+# ============================================
+
+_client = None
+
+
+def _init_worker():
+    global _client
+    import main
+    from fastapi.testclient import TestClient
+    _client = TestClient(main.app)
+
+
+def _render(path: str) -> Tuple[str, int, Optional[str], Optional[bytes], Optional[bytes]]:
+    """(경로, 상태 코드, 내용 해시, 본문, gzip 본문)"""
+    try:
+        response = _client.get(_request_url(path))
+    except Exception as e:
+        print(f"❌ 렌더링 실패: {path} ({e})")
+        return path, 500, None, None, None
+    if response.status_code != 200:
+        return path, response.status_code, None, None, None
+    body = response.content
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return path, 200, digest, body, gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _write_atomic(target: Path, content: bytes):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(content)
+    os.replace(tmp, target)
+
+
+def _remove(out_dir: Path, file: str):
+    for target in (out_dir / file, out_dir / f"{file}.gz"):
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ============================================
+# 내보내기
+# ============================================
+
+def export(out_dir: Path, workers: Optional[int] = None, full: bool = False,
+           groups: Optional[List[str]] = None) -> Dict[str, Any]:
+    """정적 파일 트리 + manifest 내보내기 (바뀐 그룹만), 결과 통계 반환"""
+    import main
+
+    start = time.time()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_FILE
+    previous: Dict[str, Any] = {}
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('groups', {})
+
+    code_version = data_version(BACKEND_DIR, sorted(p.name for p in BACKEND_DIR.glob("*.py")))
+    result_groups: Dict[str, Any] = {}
+    stats = {"groups": [], "skipped": [], "rendered": 0, "written": 0, "unchanged": 0, "removed": 0, "not_found": 0}
+
+    # 다시 렌더링할 그룹/경로 결정
+    pending: List[Tuple[str, str, str]] = []  # (그룹, 경로, 파일)
+    for name, sources, list_paths in EXPORT_GROUPS:
+        old = previous.get(name)
+        if groups and name not in groups:
+            if old:
+                result_groups[name] = old
+            continue
+        version = hashlib.blake2b(f"{code_version}:{data_version(main.DATA_DIR, sources)}".encode(),
+                                  digest_size=8).hexdigest()
+        if not full and old and old.get('version') == version and all(
+                (out_dir / entry['file']).exists() for entry in old.get('paths', {}).values()):
+            result_groups[name] = old
+            stats["skipped"].append(name)
+            continue
+
+        try:
+            paths = list_paths(main)
+        except Exception as e:
+            print(f"⚠️ {name} 경로 목록 구성 실패: {getattr(e, 'detail', None) or e}")
+            paths = []
+        result_groups[name] = {"version": version, "sources": sources, "paths": {}}
+        stats["groups"].append(name)
+        for path in dict.fromkeys(paths):
+            file = export_file(path)
+            if file:
+                pending.append((name, path, file))
+
+    # 프로세스 풀에서 렌더링, 해시가 바뀐 파일만 쓰기
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        print(f"🔄 정적 내보내기: {len(pending)}개 경로, 그룹 {', '.join(stats['groups'])} (워커 {workers}개)")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            results = pool.map(_render, [path for _, path, _ in pending], chunksize=RENDER_CHUNK_SIZE)
+            for (name, path, file), (_, status, digest, body, compressed) in zip(pending, results):
+                stats["rendered"] += 1
+                if status != 200:
+                    stats["not_found"] += 1
+                    continue
+                old_entry = previous.get(name, {}).get('paths', {}).get(path)
+                if old_entry and old_entry.get('hash') == digest and (out_dir / file).exists():
+                    stats["unchanged"] += 1
+                else:
+                    _write_atomic(out_dir / file, body)
+                    _write_atomic(out_dir / f"{file}.gz", compressed)
+                    stats["written"] += 1
+                result_groups[name]["paths"][path] = {
+                    "file": file, "hash": digest, "size": len(body), "gzip_size": len(compressed)
+                }
+
+    # 다시 렌더링한 그룹에서 사라진 경로 정리
+    for name in stats["groups"]:
+        current = result_groups[name]["paths"]
+        for path, entry in previous.get(name, {}).get('paths', {}).items():
+            if path not in current:
+                _remove(out_dir, entry['file'])
+                stats["removed"] += 1
+
+    manifest = {
+        "generated_at": datetime.now().isoformat(timespec='seconds'),
+        "data_dir": str(main.DATA_DIR),
+        "code_version": code_version,
+        "groups": result_groups,
+    }
+    _write_atomic(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
+
+    stats["files"] = sum(len(group.get('paths', {})) for group in result_groups.values())
+    stats["seconds"] = round(time.time() - start, 2)
+    print(f"✅ 정적 내보내기 완료: 렌더링 {stats['rendered']}개, 기록 {stats['written']}개, "
+          f"변경 없음 {stats['unchanged']}개, 삭제 {stats['removed']}개, "
+          f"건너뛴 그룹 {len(stats['skipped'])}개 ({stats['seconds']}초)")
+    return stats
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="읽기 전용 API 정적 내보내기")
+    parser.add_argument("--out", type=Path, default=None,
+                        help="출력 디렉토리 (기본: STATIC_EXPORT_DIR 또는 DATA_DIR/static_api)")
+    parser.add_argument("--workers", type=int, default=None, help="렌더링 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--full", action="store_true", help="데이터 버전과 관계없이 전체 다시 렌더링")
+    parser.add_argument("--groups", default=None,
+                        help=f"내보낼 그룹 (쉼표 구분: {', '.join(name for name, _, _ in EXPORT_GROUPS)})")
+    args = parser.parse_args()
+
+    import main
+    out_dir = args.out or Path(os.environ.get("STATIC_EXPORT_DIR", str(main.DATA_DIR / "static_api")))
+    groups = [g.strip() for g in args.groups.split(',') if g.strip()] if args.groups else None
+    export(out_dir, workers=args.workers, full=args.full, groups=groups)
+
+
+if __name__ == "__main__":
+    main_cli()
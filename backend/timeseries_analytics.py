@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다년도 변화 분석 (sgis_multiyear_stats.json)
+
+연도 x 읍면동 행렬을 지표별로 만들어 두고 전년 대비 증감, 증감률,
+CAGR(연평균 성장률), 변동성(전년 대비 증감률의 표준편차)을 미리 계산한다.
+급성장/급감 지역 순위는 범위(전국/시도/시군구)별 정렬 인덱스를 잘라서 응답한다.
+"""
+
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+# 지표 이름 -> (설명, 원본 그룹, 원본 필드)
+TIMESERIES_METRICS = {
+    "population": ("인구", "household", "family_member_cnt"),
+    "households": ("가구수", "household", "household_cnt"),
+    "companies": ("사업체수", "company", "corp_cnt"),
+    "workers": ("종사자수", "company", "tot_worker"),
+}
+
+# 순위 기준
+MEASURES = {
+    "cagr": "연평균 성장률",
+    "change": "증감",
+    "change_rate": "증감률",
+    "volatility": "변동성",
+}
+
+NATIONAL_SCOPE = "national"
+
+
+def _num(value) -> Optional[float]:
+    value = float(value)
+    if np.isnan(value):
+        return None
+    return int(value) if value.is_integer() else round(value, 4)
+
+
+class TimeseriesAnalytics:
+    """연도 x 읍면동 지표 행렬과 파생 지표"""
+
+    def __init__(self, years: List[str], codes: List[str], matrices: Dict[str, np.ndarray],
+                 labels: Dict[str, Dict[str, Any]]):
+        self.years = years
+        self.year_numbers = np.array([int(y) for y in years], dtype=np.float64)
+        self.codes = codes
+        self.index = {code: i for i, code in enumerate(codes)}
+        self.labels = [labels.get(code, {"code": code}) for code in codes]
+        self.values = matrices
+
+        n_codes = len(codes)
+        self.delta: Dict[str, np.ndarray] = {}
+        self.rate: Dict[str, np.ndarray] = {}
+        self.measures: Dict[str, Dict[str, np.ndarray]] = {}
+        self.first_year = {}
+        self.last_year = {}
+        columns = np.arange(n_codes)
+        for metric, matrix in matrices.items():
+            with np.errstate(invalid='ignore', divide='ignore'):
+                self.delta[metric] = np.diff(matrix, axis=0)
+                previous = matrix[:-1]
+                self.rate[metric] = np.where(previous > 0, self.delta[metric] / previous, np.nan)
+
+            # 값이 있는 첫 해/마지막 해
+            present = ~np.isnan(matrix)
+            has_any = present.any(axis=0)
+            first = np.where(has_any, present.argmax(axis=0), 0)
+            last = np.where(has_any, len(years) - 1 - present[::-1].argmax(axis=0), 0)
+            first_value = np.where(has_any, matrix[first, columns], np.nan)
+            last_value = np.where(has_any, matrix[last, columns], np.nan)
+            span = self.year_numbers[last] - self.year_numbers[first] if len(years) else np.zeros(n_codes)
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                valid = has_any & (span > 0) & (first_value > 0)
+                change = np.where(has_any & (span > 0), last_value - first_value, np.nan)
+                change_rate = np.where(valid, change / first_value, np.nan)
+                cagr = np.where(valid & (last_value >= 0),
+                                np.power(last_value / first_value, 1.0 / np.where(span > 0, span, 1)) - 1,
+                                np.nan)
+            rates = self.rate[metric]
+            rate_count = (~np.isnan(rates)).sum(axis=0) if rates.size else np.zeros(n_codes, dtype=int)
+            with np.errstate(invalid='ignore'):
+                volatility = np.full(n_codes, np.nan)
+                enough = rate_count >= 2
+                if enough.any():
+                    volatility[enough] = np.nanstd(rates[:, enough], axis=0)
+
+            self.first_year[metric] = np.where(has_any, first, -1)
+            self.last_year[metric] = np.where(has_any, last, -1)
+            self.measures[metric] = {
+                "cagr": cagr,
+                "change": change,
+                "change_rate": change_rate,
+                "volatility": volatility,
+            }
+
+        # 범위 -> 구성원 (읍면동 코드 앞 2자리: 시도, 앞 5자리: 시군구)
+        self.scopes: Dict[str, np.ndarray] = {NATIONAL_SCOPE: np.arange(n_codes)}
+        groups: Dict[str, List[int]] = {}
+        for i, code in enumerate(codes):
+            groups.setdefault(code[:2], []).append(i)
+            groups.setdefault(code[:5], []).append(i)
+        for scope, members in groups.items():
+            self.scopes[scope] = np.array(members)
+
+        # (지표, 기준, 범위) -> 내림차순 정렬 인덱스 (값 없는 읍면동 제외)
+        self.order: Dict[Tuple[str, str, str], np.ndarray] = {}
+        for metric, measures in self.measures.items():
+            for measure, values in measures.items():
+                for scope, members in self.scopes.items():
+                    scoped = values[members]
+                    finite = ~np.isnan(scoped)
+                    members_finite = members[finite]
+                    ascending = np.argsort(scoped[finite], kind='stable')
+                    self.order[(metric, measure, scope)] = members_finite[ascending[::-1]]
+
+    def movers(self, metric: str, measure: str, scope: str, k: int, descending: bool = True) -> List[Dict[str, Any]]:
+        """급성장(descending) / 급감(ascending) 지역"""
+        order = self.order[(metric, measure, scope)]
+        picked = order[:k] if descending else order[::-1][:k]
+        return [
+            {"rank": position + 1, **self.labels[i], **self._summary(metric, int(i))}
+            for position, i in enumerate(picked)
+        ]
+
+    def _summary(self, metric: str, i: int) -> Dict[str, Any]:
+        first = int(self.first_year[metric][i])
+        last = int(self.last_year[metric][i])
+        return {
+            "from_year": self.years[first] if first >= 0 else None,
+            "to_year": self.years[last] if last >= 0 else None,
+            "from_value": _num(self.values[metric][first, i]) if first >= 0 else None,
+            "to_value": _num(self.values[metric][last, i]) if last >= 0 else None,
+            **{measure: _num(values[i]) for measure, values in self.measures[metric].items()},
+        }
+
+    def compare(self, codes: List[str], metrics: List[str]) -> Dict[str, Any]:
+        """여러 읍면동의 시계열 + 파생 지표 (행렬 열 슬라이스)"""
+        found = [code for code in codes if code in self.index]
+        columns = [self.index[code] for code in found]
+        result = []
+        for code, i in zip(found, columns):
+            entry = {**self.labels[i], "metrics": {}}
+            for metric in metrics:
+                entry["metrics"][metric] = {
+                    "series": [_num(v) for v in self.values[metric][:, i]],
+                    "yoy_change": [_num(v) for v in self.delta[metric][:, i]],
+                    "yoy_rate": [_num(v) for v in self.rate[metric][:, i]],
+                    **self._summary(metric, i),
+                }
+            result.append(entry)
+        return {
+            "years": self.years,
+            "regions": result,
+            "missing": [code for code in codes if code not in self.index],
+        }
+
+
+def build_timeseries_analytics(regions_by_year: Dict[str, Dict[str, Any]],
+                               enhanced_by_year: Dict[str, Dict[str, Any]],
+                               labels: Dict[str, Dict[str, Any]]) -> TimeseriesAnalytics:
+    """sgis_multiyear_stats.json 의 regions_by_year 로 연도 x 읍면동 행렬 구성
+
+    인구/가구수는 get_emdong_detail과 같이 연령별 상세 데이터의 정확한 인구가 있으면 그 값을 쓴다.
+    """
+    start = time.time()
+    years = sorted(y for y in regions_by_year if y.isdigit())
+    codes = sorted({code for y in years for code in regions_by_year[y]})
+    index = {code: i for i, code in enumerate(codes)}
+
+    matrices = {metric: np.full((len(years), len(codes)), np.nan) for metric in TIMESERIES_METRICS}
+    for y, year in enumerate(years):
+        enhanced_year = enhanced_by_year.get(year, {})
+        for code, stats in regions_by_year[year].items():
+            i = index[code]
+            for metric, (_, group, field) in TIMESERIES_METRICS.items():
+                value = (stats.get(group) or {}).get(field)
+                if value is not None:
+                    matrices[metric][y, i] = value
+            accurate_pop = ((enhanced_year.get(code) or {}).get('basic') or {}).get('total_population', 0)
+            if accurate_pop:
+                avg_size = (stats.get('household') or {}).get('avg_family_member_cnt', 2.0) or 2.0
+                matrices["population"][y, i] = accurate_pop
+                matrices["households"][y, i] = round(accurate_pop / avg_size)
+
+    analytics = TimeseriesAnalytics(years, codes, matrices, labels)
+    print(f"✅ 다년도 변화 분석 구성 완료: {len(years)}개 연도 x {len(codes)}개 읍면동 ({time.time() - start:.2f}초)")
+    return analytics
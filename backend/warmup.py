@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터셋 백그라운드 예열 (warm-up)
+
+앱 시작 시 데이터셋 로드/색인 구성을 스레드 풀에서 동시에 실행한다.
+우선순위가 높은(숫자가 작은) 작업부터 시작하고, 의존 작업이 끝난 작업만 풀에 넣는다.
+데이터셋마다 상태(pending/loading/ready/missing/failed), 소요 시간, 오류를 기록해
+/health, /ready 에서 보여준다.
+
+- missing: 데이터 파일이 없음 (404). 선택 작업이면 다시 시도해도 달라지지 않으므로 준비 완료로 본다
+- failed: 로드/구성 중 오류
+- required 작업이 missing/failed면 준비되지 않은 것으로 본다
+"""
+
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
+
+WARMUP_WORKERS = 4
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+MISSING = "missing"
+FAILED = "failed"
+
+DONE_STATES = (READY, MISSING, FAILED)
+UNAVAILABLE_STATES = (MISSING, FAILED)
+
+
+class WarmupTask:
+    """예열 작업 1개 (데이터셋 로드 또는 색인 구성)"""
+    __slots__ = ("name", "loader", "priority", "depends", "required", "status",
+                 "started_at", "seconds", "error")
+
+    def __init__(self, name: str, loader: Callable[[], Any], priority: int,
+                 depends: List[str], required: bool):
+        self.name = name
+        self.loader = loader
+        self.priority = priority
+        self.depends = depends
+        self.required = required
+        self.status = PENDING
+        self.started_at: Optional[float] = None
+        self.seconds: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def blocking(self) -> bool:
+        """준비를 막는 작업인지 (끝나지 않았거나, required인데 파일 없음/실패)"""
+        return self.status not in DONE_STATES or (self.required and self.status in UNAVAILABLE_STATES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "status": self.status,
+            "priority": self.priority,
+            "required": self.required,
+            "seconds": self.seconds,
+        }
+        if self.depends:
+            result["depends"] = self.depends
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+def _is_missing(error: Exception) -> bool:
+    """데이터 파일 없음 (load_json_file의 404, FileNotFoundError)"""
+    return isinstance(error, FileNotFoundError) or getattr(error, 'status_code', None) == 404
+
+
+class WarmupScheduler:
+    """우선순위 + 의존성 기반 예열 스케줄러"""
+
+    def __init__(self, workers: int = WARMUP_WORKERS):
+        self.workers = workers
+        self.tasks: Dict[str, WarmupTask] = {}
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def add(self, name: str, loader: Callable[[], Any], priority: int = 0,
+            depends: Optional[List[str]] = None, required: bool = False):
+        self.tasks[name] = WarmupTask(name, loader, priority, list(depends or []), required)
+
+    def start(self):
+        """백그라운드 예열 시작 (즉시 반환)"""
+        with self.lock:
+            if self.started_at is not None:
+                return
+            self.started_at = time.time()
+            unknown = [(task.name, dep) for task in self.tasks.values() for dep in task.depends if dep not in self.tasks]
+            if unknown:
+                raise ValueError(f"알 수 없는 예열 의존 작업: {unknown}")
+            print(f"🔥 데이터 예열 시작: {len(self.tasks)}개 작업 (스레드 {self.workers}개)")
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="warmup")
+            self._schedule()
+
+    def _schedule(self):
+        """의존 작업이 모두 끝난 대기 작업을 우선순위 순으로 풀에 넣는다 (self.lock 보유 상태)"""
+        runnable = [
+            task for task in self.tasks.values()
+            if task.status == PENDING and all(self.tasks[dep].status in DONE_STATES for dep in task.depends)
+        ]
+        for task in sorted(runnable, key=lambda t: t.priority):
+            task.status = LOADING
+            self._pool.submit(self._run, task)
+
+        if all(task.status in DONE_STATES for task in self.tasks.values()):
+            self.finished_at = time.time()
+            self.done.set()
+            self._pool.shutdown(wait=False)
+            summary = {state: sum(1 for t in self.tasks.values() if t.status == state) for state in DONE_STATES}
+            print(f"✅ 데이터 예열 완료: 준비 {summary[READY]}개, 파일 없음 {summary[MISSING]}개, "
+                  f"실패 {summary[FAILED]}개 ({self.finished_at - self.started_at:.2f}초)")
+
+    def _run(self, task: WarmupTask):
+        task.started_at = time.time()
+        try:
+            task.loader()
+            status, error = READY, None
+        except Exception as e:
+            detail = getattr(e, 'detail', None) or str(e) or type(e).__name__
+            if _is_missing(e):
+                status, error = MISSING, detail
+            else:
+                status, error = FAILED, detail
+                print(f"❌ 데이터 예열 실패: {task.name} ({detail})")
+                traceback.print_exc()
+        with self.lock:
+            task.seconds = round(time.time() - task.started_at, 3)
+            task.status = status
+            task.error = error
+            self._schedule()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+    @property
+    def ready(self) -> bool:
+        """모든 작업이 끝났고 required 작업이 모두 준비되었는지"""
+        return self.done.is_set() and not any(task.blocking for task in self.tasks.values())
+
+    def status(self) -> Dict[str, Any]:
+        with self.lock:
+            tasks = sorted(self.tasks.values(), key=lambda t: (t.priority, t.name))
+            if not self.done.is_set():
+                state = "warming" if self.started_at is not None else "starting"
+            elif not self.ready:
+                state = "unhealthy"
+            elif any(task.status == FAILED for task in tasks):
+                state = "degraded"
+            else:
+                state = "healthy"
+            end = self.finished_at or time.time()
+            return {
+                "status": state,
+                "ready": self.ready,
+                "elapsed": round(end - self.started_at, 3) if self.started_at else None,
+                "datasets": {task.name: task.to_dict() for task in tasks},
+            }
+
+    def not_ready(self) -> List[str]:
+        """아직 준비되지 않은 작업 (대기/로드 중, 또는 파일이 없거나 실패한 required 작업)"""
+        with self.lock:
+            return [task.name for task in self.tasks.values() if task.blocking]